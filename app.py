@@ -4,18 +4,17 @@ Combined application for 3D printing price calculation and filament inventory ma
 """
 
 import sys
-import os
 from typing import Optional, Dict
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QGroupBox, QComboBox, QCheckBox,
     QMessageBox, QFormLayout, QFileDialog, QDialog, QDialogButtonBox,
-    QScrollArea, QSpinBox, QDoubleSpinBox, QListWidget, QListWidgetItem,
+    QScrollArea, QSpinBox, QDoubleSpinBox,
     QSizePolicy, QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView,
-    QColorDialog
+    QColorDialog, QStackedWidget
 )
-from PyQt5.QtCore import Qt, QMimeData, QTimer
-from PyQt5.QtGui import QFont, QDragEnterEvent, QDropEvent, QColor, QBrush, QPixmap, QIcon, QPainter
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont, QColor, QPalette
 
 from utils.db_handler import (
     add_brand, add_filament, add_print, delete_filament,
@@ -28,69 +27,208 @@ from utils.translations import (
     t, toggle_language, register_language_callback, get_language,
     cycle_currency, get_currency, register_currency_callback, format_currency as fmt_currency,
     load_preferences, get_font_size, set_font_size, register_font_size_callback,
-    get_font_size_px, FONT_SIZES
+    get_font_size_px, FONT_SIZES, CURRENCIES, set_currency, set_language
 )
+from tabs.calculator_tab import CalculatorTab
+from tabs.inventory_tab import InventoryTab
+from tabs.history_tab import HistoryTab
+from dialogs.settings_dialog import SettingsDialog
 
 
-class DragDropListWidget(QListWidget):
-    """List widget with drag and drop support for G-code files."""
+# Header combo codes -> translation keys for their display text
+_CURRENCY_LABEL_KEYS = {
+    "PLN": "currency_pln",
+    "EUR": "currency_eur",
+    "USD": "currency_usd",
+    "GBP": "currency_gbp",
+}
+_LANGUAGE_LABEL_KEYS = {
+    "PL": "language_pl",
+    "EN": "language_en",
+}
+_FONT_SIZE_LABEL_KEYS = {
+    "small": "font_size_small",
+    "medium": "font_size_medium",
+    "large": "font_size_large",
+}
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAcceptDrops(True)
-        self.setDragDropMode(QListWidget.DropOnly)
-        self.setSelectionMode(QListWidget.ExtendedSelection)
 
-    def dragEnterEvent(self, event: QDragEnterEvent):
-        """Handle drag enter event."""
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            gcode_files = [url for url in urls if url.toLocalFile().lower().endswith(
-                ('.gcode', '.gco', '.nc', '.bgcode')
-            )]
-            if gcode_files:
-                event.acceptProposedAction()
-
-    def dragMoveEvent(self, event):
-        """Handle drag move event."""
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-
-    def dropEvent(self, event: QDropEvent):
-        """Handle drop event."""
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            for url in urls:
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.gcode', '.gco', '.nc', '.bgcode')):
-                    if not any(self.item(i).data(Qt.UserRole) == file_path 
-                             for i in range(self.count())):
-                        item = QListWidgetItem(os.path.basename(file_path))
-                        item.setData(Qt.UserRole, file_path)
-                        self.addItem(item)
-            event.acceptProposedAction()
+# Application-wide stylesheet (dark theme + header widgets), formatted with
+# the current font sizes and applied once on the QApplication.
+# Base window/text colors come from the palette set in main().
+APP_STYLESHEET = """
+QWidget {{
+    font-family: 'Segoe UI', Arial, sans-serif;
+}}
+QGroupBox {{
+    border: 1px solid #333;
+    border-radius: 12px;
+    margin-top: 16px;
+    padding-top: 16px;
+    font-weight: 600;
+    font-size: {title_size}px;
+    color: #b0b0b0;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}}
+QGroupBox::title {{
+    subcontrol-origin: margin;
+    left: 16px;
+    padding: 0 8px;
+}}
+QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{
+    background-color: #1e1e1e;
+    border: 1px solid #3a3a3a;
+    border-radius: 8px;
+    padding: 10px 14px;
+    font-size: {base_size}px;
+    color: #ffffff;
+    selection-background-color: #7c3aed;
+}}
+QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
+    border: 2px solid #7c3aed;
+    background-color: #252525;
+}}
+QLineEdit:hover, QComboBox:hover, QSpinBox:hover, QDoubleSpinBox:hover {{
+    border: 1px solid #555;
+    background-color: #222;
+}}
+QComboBox:disabled {{
+    background-color: #1a1a1a;
+    border: 1px solid #2a2a2a;
+    color: #666;
+}}
+QComboBox::drop-down {{
+    border: none;
+}}
+QComboBox QAbstractItemView {{
+    background-color: #1e1e1e;
+    border: 1px solid #3a3a3a;
+    selection-background-color: #7c3aed;
+}}
+QPushButton {{
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #7c3aed, stop:1 #6d28d9);
+    border: none;
+    border-radius: 8px;
+    padding: 10px 20px;
+    font-size: {button_size}px;
+    font-weight: 600;
+    color: white;
+}}
+QPushButton:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #8b5cf6, stop:1 #7c3aed);
+}}
+QPushButton:pressed {{
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #6d28d9, stop:1 #5b21b6);
+}}
+QLabel {{
+    font-size: {label_size}px;
+}}
+QTableWidget, QTableView#dataTable {{
+    background-color: #1e1e1e;
+    alternate-background-color: #1e1e1e;
+    color: #e0e0e0;
+    border: 1px solid #333;
+    border-radius: 8px;
+    gridline-color: #333;
+    selection-background-color: #7c3aed;
+}}
+QTableWidget::item, QTableView#dataTable::item {{
+    background-color: #1e1e1e;
+    padding: 8px;
+    color: #e0e0e0;
+    font-size: {base_size}px;
+}}
+QTableWidget::item:selected, QTableView#dataTable::item:selected {{
+    background-color: #7c3aed;
+    color: white;
+}}
+QHeaderView::section {{
+    background-color: #252525;
+    color: #e0e0e0;
+    padding: 10px;
+    border: none;
+    border-bottom: 2px solid #7c3aed;
+    font-weight: 600;
+    font-size: {base_size}px;
+}}
+QWidget#headerBar {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7c3aed, stop:1 #3b82f6);
+}}
+QPushButton#tabButton {{
+    border: none;
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+    border-bottom-left-radius: 0px;
+    border-bottom-right-radius: 0px;
+    padding: 12px 24px;
+    font-size: 14px;
+    font-weight: 600;
+}}
+QPushButton#tabButton[tabActive="true"] {{
+    background: #121212;
+    color: white;
+}}
+QPushButton#tabButton[tabActive="false"] {{
+    background: rgba(255, 255, 255, 0.1);
+    color: rgba(255, 255, 255, 0.8);
+}}
+QPushButton#tabButton[tabActive="false"]:hover {{
+    background: rgba(255, 255, 255, 0.2);
+    color: white;
+}}
+QComboBox#headerCombo {{
+    background: rgba(255, 255, 255, 0.15);
+    border: 1px solid rgba(255, 255, 255, 0.3);
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: {base_size}px;
+    font-weight: 600;
+    color: white;
+}}
+QComboBox#headerCombo:hover {{
+    background: rgba(255, 255, 255, 0.25);
+}}
+QComboBox#headerCombo::drop-down {{
+    border: none;
+    width: 20px;
+}}
+QComboBox#headerCombo::down-arrow {{
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 5px solid white;
+    margin-right: 5px;
+}}
+QComboBox#headerCombo QAbstractItemView {{
+    background-color: #1e1e1e;
+    border: 1px solid #3a3a3a;
+    border-radius: 8px;
+    selection-background-color: #7c3aed;
+    color: white;
+    padding: 4px;
+    font-size: {base_size}px;
+}}
+QPushButton#headerButton {{
+    background: rgba(255, 255, 255, 0.15);
+    border: 1px solid rgba(255, 255, 255, 0.3);
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: {base_size}px;
+    font-weight: 600;
+    color: white;
+}}
+QPushButton#headerButton:hover {{
+    background: rgba(255, 255, 255, 0.25);
+}}
+"""
 
 
-def create_color_icon(color_str: str, size: int = 20) -> QIcon:
-    """Create a colored square icon for combo boxes."""
-    if not color_str.startswith('#'):
-        color_str = '#' + color_str
-    color = QColor(color_str)
-    if not color.isValid():
-        color = QColor("#000000")
-    
-    pixmap = QPixmap(size, size)
-    pixmap.fill(QColor(0, 0, 0, 0))
-    
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-    painter.setBrush(QBrush(color))
-    painter.setPen(QColor(0, 0, 0, 0))
-    margin = 2
-    painter.drawRect(margin, margin, size - 2 * margin, size - 2 * margin)
-    painter.end()
-    
-    return QIcon(pixmap)
+# Formatted APP_STYLESHEET per font size key ("small" | "medium" | "large")
+_THEME_CACHE: Dict[str, str] = {}
 
 
 class MainWindow(QMainWindow):
@@ -118,20 +256,16 @@ class MainWindow(QMainWindow):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
-        # Create tabs
-        from tabs.calculator_tab import CalculatorTab
-        from tabs.inventory_tab import InventoryTab
-        from tabs.history_tab import HistoryTab
-        
+        # Create tabs (inventory and history are built on first switch)
         self.calculator_tab = CalculatorTab(self.config, self)
-        self.inventory_tab = InventoryTab(self)
-        self.inventory_tab.set_main_window(self)  # Pass reference for refreshing calculator
-        self.history_tab = HistoryTab(self)
+        self.calculator_tab.set_main_window(self)  # Pass reference for marking tabs dirty
+        self.inventory_tab = None
+        self.history_tab = None
         
         # New structure: header + content
         header_widget = QWidget()
         header_widget.setFixedHeight(60)
-        header_widget.setStyleSheet("background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7c3aed, stop:1 #3b82f6);")
+        header_widget.setObjectName("headerBar")
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(0, 0, 16, 0)
         header_layout.setSpacing(8)
@@ -147,19 +281,33 @@ class MainWindow(QMainWindow):
             btn.setProperty("tab_index", i)
             btn.setProperty("tab_name", name)
             btn.clicked.connect(lambda checked, idx=i: self.switch_tab(idx))
-            btn.setStyleSheet(self._get_tab_button_style(i == 0))
+            btn.setObjectName("tabButton")
+            btn.setProperty("tabActive", i == 0)
             self.tab_buttons.append(btn)
             header_layout.addWidget(btn)
         
         header_layout.addStretch()
         
+        # Coalesce rapid currency/language selections (e.g. keyboard scrolling
+        # through a combo) into a single update cascade
+        self._pending_currency = None
+        self._currency_timer = QTimer(self)
+        self._currency_timer.setSingleShot(True)
+        self._currency_timer.setInterval(50)
+        self._currency_timer.timeout.connect(self._apply_currency_change)
+        self._pending_language = None
+        self._language_timer = QTimer(self)
+        self._language_timer.setSingleShot(True)
+        self._language_timer.setInterval(50)
+        self._language_timer.timeout.connect(self._apply_language_change)
+        
         # Currency combo box in header
         self.currency_combo = QComboBox()
         self.currency_combo.setMinimumWidth(100)
         self.currency_combo.setMinimumHeight(36)
         self._populate_currency_combo()
-        self.currency_combo.currentTextChanged.connect(self.on_currency_changed)
-        # Style will be applied in _apply_header_styles()
+        self.currency_combo.currentIndexChanged.connect(self.on_currency_changed)
+        self.currency_combo.setObjectName("headerCombo")
         header_layout.addWidget(self.currency_combo)
         
         # Language combo box in header
@@ -167,8 +315,8 @@ class MainWindow(QMainWindow):
         self.lang_combo.setMinimumWidth(80)
         self.lang_combo.setMinimumHeight(36)
         self._populate_language_combo()
-        self.lang_combo.currentTextChanged.connect(self.on_language_changed)
-        # Style will be applied in _apply_header_styles()
+        self.lang_combo.currentIndexChanged.connect(self.on_language_changed)
+        self.lang_combo.setObjectName("headerCombo")
         header_layout.addWidget(self.lang_combo)
         
         # Font size combo box in header
@@ -176,8 +324,8 @@ class MainWindow(QMainWindow):
         self.font_size_combo.setMinimumWidth(100)
         self.font_size_combo.setMinimumHeight(36)
         self._populate_font_size_combo()
-        self.font_size_combo.currentTextChanged.connect(self.on_font_size_changed)
-        # Style will be applied in _apply_header_styles()
+        self.font_size_combo.currentIndexChanged.connect(self.on_font_size_changed)
+        self.font_size_combo.setObjectName("headerCombo")
         header_layout.addWidget(self.font_size_combo)
         
         # Settings button in header
@@ -185,31 +333,20 @@ class MainWindow(QMainWindow):
         self.settings_button.setMinimumWidth(130)
         self.settings_button.setMinimumHeight(36)
         self.settings_button.clicked.connect(self.open_settings)
-        # Style will be applied in _apply_header_styles()
+        self.settings_button.setObjectName("headerButton")
         header_layout.addWidget(self.settings_button)
         
-        # Apply header styles (after all widgets are created)
-        self._apply_header_styles()
-        
         main_layout.addWidget(header_widget)
         
         # Stacked content for tabs
-        self.content_stack = QWidget()
-        self.content_stack_layout = QVBoxLayout(self.content_stack)
-        self.content_stack_layout.setContentsMargins(0, 0, 0, 0)
-        self.content_stack_layout.setSpacing(0)
-        
-        # Add all tabs to stack (only one visible at a time)
-        self.tab_widgets = [self.calculator_tab, self.inventory_tab, self.history_tab]
-        for widget in self.tab_widgets:
-            self.content_stack_layout.addWidget(widget)
-            widget.setVisible(False)
-        self.tab_widgets[0].setVisible(True)
-        self.current_tab = 0
+        self.content_stack = QStackedWidget()
         
-        # Register calculator tab for font size updates
-        if hasattr(self.calculator_tab, 'update_font_size'):
-            register_font_size_callback(self.calculator_tab.update_font_size)
+        # Add calculator tab to stack; other tabs are added when first opened
+        self.tab_widgets = [self.calculator_tab, None, None]
+        self.content_stack.addWidget(self.calculator_tab)
+        self.current_tab = 0
+        # Tabs whose data changed while they were hidden
+        self._dirty = {1: False, 2: False}
         
         main_layout.addWidget(self.content_stack)
         
@@ -220,87 +357,80 @@ class MainWindow(QMainWindow):
         register_currency_callback(self.update_currency)
         
         # Register for font size changes
+        self._font_apply_pending = False
         register_font_size_callback(self.update_font_size)
+        
+        # Tabs receive language/currency changes directly, once they exist
+        self._register_tab_callbacks(self.calculator_tab)
+
+    def _register_tab_callbacks(self, widget: QWidget):
+        """Register a tab's own language/currency handlers."""
+        if hasattr(widget, 'update_translations'):
+            register_language_callback(widget.update_translations)
+        if hasattr(widget, 'update_currency'):
+            register_currency_callback(widget.update_currency)
 
-    def _get_tab_button_style(self, is_active: bool) -> str:
-        """Get style for tab button based on active state."""
-        if is_active:
-            return """
-                QPushButton {
-                    background: #121212;
-                    border: none;
-                    border-top-left-radius: 8px;
-                    border-top-right-radius: 8px;
-                    border-bottom-left-radius: 0px;
-                    border-bottom-right-radius: 0px;
-                    padding: 12px 24px;
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: white;
-                }
-            """
+    def _create_tab(self, index: int) -> QWidget:
+        """Create the tab widget for the given index on first activation."""
+        if index == 1:
+            widget = InventoryTab(self)
+            widget.set_main_window(self)  # Pass reference for refreshing calculator
+            self.inventory_tab = widget
         else:
-            return """
-                QPushButton {
-                    background: rgba(255, 255, 255, 0.1);
-                    border: none;
-                    border-top-left-radius: 8px;
-                    border-top-right-radius: 8px;
-                    border-bottom-left-radius: 0px;
-                    border-bottom-right-radius: 0px;
-                    padding: 12px 24px;
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: rgba(255, 255, 255, 0.8);
-                }
-                QPushButton:hover {
-                    background: rgba(255, 255, 255, 0.2);
-                    color: white;
-                }
-            """
+            widget = HistoryTab(self)
+            widget.set_main_window(self)  # Pass reference for marking tabs dirty
+            self.history_tab = widget
+        
+        self.tab_widgets[index] = widget
+        self.content_stack.addWidget(widget)
+        self._register_tab_callbacks(widget)
+        return widget
 
     def switch_tab(self, index: int):
         """Switch to the specified tab."""
-        # Hide all tabs
-        for i, widget in enumerate(self.tab_widgets):
-            widget.setVisible(i == index)
-            self.tab_buttons[i].setStyleSheet(self._get_tab_button_style(i == index))
+        widget = self.tab_widgets[index]
+        created = widget is None
+        if created:
+            widget = self._create_tab(index)
+        
+        # Stack order follows creation order, so select by widget
+        self.content_stack.setCurrentWidget(widget)
+        
+        # Only the previously active and the newly active button change state
+        for i in {self.current_tab, index}:
+            btn = self.tab_buttons[i]
+            btn.setProperty("tabActive", i == index)
+            # Re-evaluate the [tabActive] selectors without reparsing any CSS
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
         
         self.current_tab = index
         
-        # Refresh data when switching
-        if index == 1:
-            self.inventory_tab.refresh_table()
-        elif index == 2:
-            self.history_tab.refresh_table()
+        # Refresh data only if it changed since the tab was last shown
+        # (a freshly created tab already loaded its data)
+        if not created and self._dirty.get(index):
+            widget.refresh_table()
+        self._dirty[index] = False
+
+    def mark_dirty(self, *indices: int):
+        """Mark tabs whose data changed so they refresh on next activation."""
+        for index in indices:
+            widget = self.tab_widgets[index]
+            if widget is None:
+                continue  # Not created yet - will load fresh data on first switch
+            if index == self.current_tab:
+                widget.refresh_table()
+            else:
+                self._dirty[index] = True
 
     def update_currency(self):
         """Update UI after currency change."""
-        from utils.translations import get_currency, t, CURRENCIES
-        current_currency = get_currency()
-        
-        # Update currency combo selection
-        for i in range(self.currency_combo.count()):
-            if self.currency_combo.itemData(i) == current_currency:
-                self.currency_combo.blockSignals(True)
-                self.currency_combo.setCurrentIndex(i)
-                self.currency_combo.blockSignals(False)
-                break
-        
-        # Update currency combo text
+        # Rebuild currency combo (also selects the current currency)
+        # Tabs update themselves through their own registered callbacks
         self._populate_currency_combo()
-        
-        # Update child tabs
-        if hasattr(self.calculator_tab, 'update_currency'):
-            self.calculator_tab.update_currency()
-        if hasattr(self.history_tab, 'update_currency'):
-            self.history_tab.update_currency()
 
     def update_translations(self):
         """Update all UI text after language change."""
-        from utils.translations import get_language
-        current_lang = get_language()
-        
         # Update tab buttons
         tab_names = ["calculator", "inventory", "history"]
         for i, name in enumerate(tab_names):
@@ -309,306 +439,121 @@ class MainWindow(QMainWindow):
         # Update header buttons
         self.settings_button.setText(t("settings"))
         
-        # Update language combo
-        self._populate_language_combo()
-        
-        # Update currency combo (to update translations)
-        self._populate_currency_combo()
-        
-        # Update font size combo (to update translations)
-        self._populate_font_size_combo()
-        
-        # Update child tabs
-        if hasattr(self.calculator_tab, 'update_translations'):
-            self.calculator_tab.update_translations()
-        if hasattr(self.inventory_tab, 'update_translations'):
-            self.inventory_tab.update_translations()
-        if hasattr(self.history_tab, 'update_translations'):
-            self.history_tab.update_translations()
+        # Retranslate header combos in place (items and order are unchanged)
+        self._retranslate_combo(
+            self.lang_combo, [t(key) for key in _LANGUAGE_LABEL_KEYS.values()], get_language()
+        )
+        self._retranslate_combo(self.currency_combo, self._currency_texts(list(CURRENCIES.keys())))
+        self._retranslate_combo(
+            self.font_size_combo, [t(key) for key in _FONT_SIZE_LABEL_KEYS.values()]
+        )
 
-    def _apply_header_styles(self):
-        """Apply styles to header combo boxes and buttons with current font size."""
-        from utils.translations import get_font_size_px
-        base_size = get_font_size_px("base")
-        
-        header_combo_style = f"""
-            QComboBox {{
-                background: rgba(255, 255, 255, 0.15);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: {base_size}px;
-                font-weight: 600;
-                color: white;
-            }}
-            QComboBox:hover {{
-                background: rgba(255, 255, 255, 0.25);
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid white;
-                margin-right: 5px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: #1e1e1e;
-                border: 1px solid #3a3a3a;
-                border-radius: 8px;
-                selection-background-color: #7c3aed;
-                color: white;
-                padding: 4px;
-                font-size: {base_size}px;
-            }}
-        """
-        
-        header_button_style = f"""
-            QPushButton {{
-                background: rgba(255, 255, 255, 0.15);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: {base_size}px;
-                font-weight: 600;
-                color: white;
-            }}
-            QPushButton:hover {{
-                background: rgba(255, 255, 255, 0.25);
-            }}
-        """
-        
-        self.currency_combo.setStyleSheet(header_combo_style)
-        self.lang_combo.setStyleSheet(header_combo_style)
-        self.font_size_combo.setStyleSheet(header_combo_style)
-        self.settings_button.setStyleSheet(header_button_style)
-    
     def _apply_theme(self):
-        """Apply modern dark theme with purple/blue accents."""
-        # Get current font sizes
-        base_size = get_font_size_px("base")
-        label_size = get_font_size_px("label")
-        button_size = get_font_size_px("button")
-        title_size = get_font_size_px("title")
-        
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: #121212;
-            }}
-            QWidget {{
-                background-color: #121212;
-                color: #e0e0e0;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }}
-            QGroupBox {{
-                border: 1px solid #333;
-                border-radius: 12px;
-                margin-top: 16px;
-                padding-top: 16px;
-                font-weight: 600;
-                font-size: {title_size}px;
-                color: #b0b0b0;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 16px;
-                padding: 0 8px;
-            }}
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{
-                background-color: #1e1e1e;
-                border: 1px solid #3a3a3a;
-                border-radius: 8px;
-                padding: 10px 14px;
-                font-size: {base_size}px;
-                color: #ffffff;
-                selection-background-color: #7c3aed;
-            }}
-            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
-                border: 2px solid #7c3aed;
-                background-color: #252525;
-            }}
-            QLineEdit:hover, QComboBox:hover, QSpinBox:hover, QDoubleSpinBox:hover {{
-                border: 1px solid #555;
-                background-color: #222;
-            }}
-            QComboBox:disabled {{
-                background-color: #1a1a1a;
-                border: 1px solid #2a2a2a;
-                color: #666;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: #1e1e1e;
-                border: 1px solid #3a3a3a;
-                selection-background-color: #7c3aed;
-            }}
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #7c3aed, stop:1 #6d28d9);
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: {button_size}px;
-                font-weight: 600;
-                color: white;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #8b5cf6, stop:1 #7c3aed);
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6d28d9, stop:1 #5b21b6);
-            }}
-            QLabel {{
-                color: #e0e0e0;
-                font-size: {label_size}px;
-            }}
-            QTableWidget {{
-                background-color: #1e1e1e;
-                border: 1px solid #333;
-                border-radius: 8px;
-                gridline-color: #333;
-                selection-background-color: #7c3aed;
-            }}
-            QTableWidget::item {{
-                padding: 8px;
-                color: #e0e0e0;
-                font-size: {base_size}px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: #7c3aed;
-                color: white;
-            }}
-            QHeaderView::section {{
-                background-color: #252525;
-                color: #e0e0e0;
-                padding: 10px;
-                border: none;
-                border-bottom: 2px solid #7c3aed;
-                font-weight: 600;
-                font-size: {base_size}px;
-            }}
-        """)
-
-    def on_tab_changed(self, index: int):
-        """Handle tab change to refresh data."""
-        if index == 1:  # Inventory tab
-            self.inventory_tab.refresh_table()
-        elif index == 2:  # History tab
-            self.history_tab.refresh_table()
+        """Apply modern dark theme with purple/blue accents to the whole application."""
+        size_key = get_font_size()
+        stylesheet = _THEME_CACHE.get(size_key)
+        if stylesheet is None:
+            stylesheet = APP_STYLESHEET.format(
+                base_size=get_font_size_px("base"),
+                label_size=get_font_size_px("label"),
+                button_size=get_font_size_px("button"),
+                title_size=get_font_size_px("title")
+            )
+            _THEME_CACHE[size_key] = stylesheet
+        QApplication.instance().setStyleSheet(stylesheet)
 
     def _populate_currency_combo(self):
         """Populate currency combo box with available currencies."""
-        from utils.translations import CURRENCIES, get_currency, t
-        self.currency_combo.blockSignals(True)
-        self.currency_combo.clear()
-        
-        current_currency = get_currency()
-        for currency_code in CURRENCIES.keys():
-            if currency_code == "PLN":
-                display_text = t("currency_pln")
-            elif currency_code == "EUR":
-                display_text = t("currency_eur")
-            elif currency_code == "USD":
-                display_text = t("currency_usd")
-            elif currency_code == "GBP":
-                display_text = t("currency_gbp")
-            else:
-                display_text = f"💰 {currency_code}"
-            
-            self.currency_combo.addItem(display_text, currency_code)
-            if currency_code == current_currency:
-                self.currency_combo.setCurrentIndex(self.currency_combo.count() - 1)
-        
-        self.currency_combo.blockSignals(False)
+        codes = list(CURRENCIES.keys())
+        self._fill_combo(self.currency_combo, codes, self._currency_texts(codes), get_currency())
+    
+    @staticmethod
+    def _currency_texts(codes: list) -> list:
+        """Display texts for currency codes."""
+        return [
+            t(_CURRENCY_LABEL_KEYS[code]) if code in _CURRENCY_LABEL_KEYS else f"💰 {code}"
+            for code in codes
+        ]
     
     def _populate_language_combo(self):
         """Populate language combo box with available languages."""
-        from utils.translations import get_language, t
-        self.lang_combo.blockSignals(True)
-        self.lang_combo.clear()
-        
-        current_lang = get_language()
-        # Add Polish
-        self.lang_combo.addItem(t("language_pl"), "PL")
-        if current_lang == "PL":
-            self.lang_combo.setCurrentIndex(0)
-        
-        # Add English
-        self.lang_combo.addItem(t("language_en"), "EN")
-        if current_lang == "EN":
-            self.lang_combo.setCurrentIndex(1)
-        
-        self.lang_combo.blockSignals(False)
+        codes = list(_LANGUAGE_LABEL_KEYS.keys())
+        texts = [t(key) for key in _LANGUAGE_LABEL_KEYS.values()]
+        self._fill_combo(self.lang_combo, codes, texts, get_language())
+    
+    @staticmethod
+    def _fill_combo(combo: QComboBox, codes: list, texts: list, current_code: str):
+        """Refill combo in one batch and select the current code once."""
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(texts)
+        for i, code in enumerate(codes):
+            combo.setItemData(i, code)
+        combo.setCurrentIndex(codes.index(current_code) if current_code in codes else 0)
+        combo.blockSignals(False)
     
-    def on_currency_changed(self, text):
-        """Handle currency selection change."""
-        from utils.translations import set_currency
-        currency_code = self.currency_combo.currentData()
-        if currency_code:
-            set_currency(currency_code)
+    @staticmethod
+    def _retranslate_combo(combo: QComboBox, texts: list, current_code: Optional[str] = None):
+        """Update item texts in place (items and their data stay the same)."""
+        for i, text in enumerate(texts):
+            combo.setItemText(i, text)
+        # Keep selection in sync if the value was changed outside the combo
+        if current_code is not None and combo.currentData() != current_code:
+            index = combo.findData(current_code)
+            if index >= 0:
+                combo.blockSignals(True)
+                combo.setCurrentIndex(index)
+                combo.blockSignals(False)
     
-    def on_language_changed(self, text):
-        """Handle language selection change."""
-        from utils.translations import set_language
-        lang_code = self.lang_combo.currentData()
-        if lang_code:
-            set_language(lang_code)
+    def on_currency_changed(self, index: int):
+        """Handle currency selection change (applied after the selection settles)."""
+        self._pending_currency = self.currency_combo.itemData(index)
+        self._currency_timer.start()
+    
+    def _apply_currency_change(self):
+        """Apply the last selected currency."""
+        if self._pending_currency:
+            set_currency(self._pending_currency)
+        self._pending_currency = None
+    
+    def on_language_changed(self, index: int):
+        """Handle language selection change (applied after the selection settles)."""
+        self._pending_language = self.lang_combo.itemData(index)
+        self._language_timer.start()
+    
+    def _apply_language_change(self):
+        """Apply the last selected language."""
+        if self._pending_language:
+            set_language(self._pending_language)
+        self._pending_language = None
     
     def _populate_font_size_combo(self):
         """Populate font size combo box with available sizes."""
-        from utils.translations import get_font_size, t
-        self.font_size_combo.blockSignals(True)
-        self.font_size_combo.clear()
-        
-        current_size = get_font_size()
-        sizes = [
-            ("small", t("font_size_small")),
-            ("medium", t("font_size_medium")),
-            ("large", t("font_size_large"))
-        ]
-        
-        for size_code, size_text in sizes:
-            self.font_size_combo.addItem(size_text, size_code)
-            if size_code == current_size:
-                self.font_size_combo.setCurrentIndex(self.font_size_combo.count() - 1)
-        
-        self.font_size_combo.blockSignals(False)
+        codes = list(_FONT_SIZE_LABEL_KEYS.keys())
+        texts = [t(key) for key in _FONT_SIZE_LABEL_KEYS.values()]
+        self._fill_combo(self.font_size_combo, codes, texts, get_font_size())
     
-    def on_font_size_changed(self, text):
+    def on_font_size_changed(self, index: int):
         """Handle font size selection change."""
-        from utils.translations import set_font_size
-        size_code = self.font_size_combo.currentData()
+        size_code = self.font_size_combo.itemData(index)
         if size_code:
             set_font_size(size_code)
     
     def update_font_size(self):
-        """Update UI after font size change."""
-        from utils.translations import get_font_size
-        current_size = get_font_size()
-        
-        # Update font size combo selection
-        for i in range(self.font_size_combo.count()):
-            if self.font_size_combo.itemData(i) == current_size:
-                self.font_size_combo.blockSignals(True)
-                self.font_size_combo.setCurrentIndex(i)
-                self.font_size_combo.blockSignals(False)
-                break
-        
-        # Update font size combo text
+        """Schedule the UI update after font size change (one restyle per event-loop tick)."""
+        if not self._font_apply_pending:
+            self._font_apply_pending = True
+            QTimer.singleShot(0, self._flush_font_apply)
+
+    def _flush_font_apply(self):
+        """Apply the pending font size change."""
+        self._font_apply_pending = False
+        
+        # Rebuild font size combo (also selects the current size)
         self._populate_font_size_combo()
         
         # Reapply theme with new font sizes
         self._apply_theme()
-        self._apply_header_styles()
         
         # Update child tabs if they have update_font_size method
         if hasattr(self.calculator_tab, 'update_font_size'):
@@ -625,7 +570,6 @@ class MainWindow(QMainWindow):
 
     def open_settings(self):
         """Open settings dialog."""
-        from dialogs.settings_dialog import SettingsDialog
         dialog = SettingsDialog(self.config, self)
         if dialog.exec_() == QDialog.Accepted:
             self.config = dialog.get_config()
@@ -637,6 +581,20 @@ class MainWindow(QMainWindow):
 def main():
     """Main entry point for the application."""
     app = QApplication(sys.argv)
+    
+    # Dark palette shared by all widgets (stylesheet keeps only the specifics)
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor("#121212"))
+    palette.setColor(QPalette.WindowText, QColor("#e0e0e0"))
+    palette.setColor(QPalette.Base, QColor("#1e1e1e"))
+    palette.setColor(QPalette.AlternateBase, QColor("#1e1e1e"))
+    palette.setColor(QPalette.Text, QColor("#e0e0e0"))
+    palette.setColor(QPalette.Button, QColor("#1e1e1e"))
+    palette.setColor(QPalette.ButtonText, QColor("#ffffff"))
+    palette.setColor(QPalette.Highlight, QColor("#7c3aed"))
+    palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
+    app.setPalette(palette)
+    
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
@@ -3,22 +3,44 @@ Dialog for adding a new filament.
 """
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
-    QSpinBox, QCheckBox, QDialogButtonBox, QMessageBox
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QPushButton, QComboBox,
+    QSpinBox, QCheckBox, QDialogButtonBox, QMessageBox, QColorDialog
 )
-from PyQt5.QtGui import QColor
-from PyQt5.QtCore import QEvent
+from PyQt5.QtGui import QColor, QIcon, QPixmap, QStandardItem, QStandardItemModel
+from PyQt5.QtCore import QEvent, QSize, QTimer, pyqtSlot
 
-from utils.db_handler import add_filament, get_all_brands, get_spool_weight
+from utils.db_handler import add_filament, get_brand_spool_weights, get_brands_version
 from utils.translations import t
 
 
+# Brand names shared by every AddFilamentDialog; rebuilt only when brands change
+_brands_model = None
+_brands_model_version = -1
+
+
+def _shared_brands_model(brands):
+    """Return the shared brand combo model, refilling it if brands changed."""
+    global _brands_model, _brands_model_version
+    if _brands_model is None:
+        _brands_model = QStandardItemModel()
+    version = get_brands_version()
+    if version != _brands_model_version:
+        _brands_model.clear()
+        for name in brands:
+            _brands_model.appendRow(QStandardItem(name))
+        _brands_model_version = version
+    return _brands_model
+
+
 class AddFilamentDialog(QDialog):
     """Dialog for adding a new filament."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_color = QColor("#FF0000")
+        self._spool_weights = {}  # brand -> spool weight, loaded with the brand list
+        self._current_spool_weight = 150  # Spool weight of the selected brand
+        self._err_box = QMessageBox(QMessageBox.Warning, t("error"), "", QMessageBox.Ok, self)  # Reused for warnings
         self.init_ui()
 
     def init_ui(self):
@@ -32,68 +54,63 @@ class AddFilamentDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
         self.setLayout(layout)
 
+        # Label/field rows share one form layout
+        form = QFormLayout()
+        form.setVerticalSpacing(15)
+        layout.addLayout(form)
+
         # Color selection
         color_layout = QHBoxLayout()
         self.color_label_title = QLabel(t("color_label"))
-        color_layout.addWidget(self.color_label_title)
         self.color_btn = QPushButton()
         self.color_btn.setFixedSize(50, 30)
-        self.color_btn.setStyleSheet(f"background-color: {self.selected_color.name()};")
+        self.color_btn.setIconSize(QSize(40, 20))
+        self._apply_color(self.selected_color)
         self.color_btn.clicked.connect(self.choose_color)
         color_layout.addWidget(self.color_btn)
         self.color_label = QLabel(self.selected_color.name())
         color_layout.addWidget(self.color_label)
         color_layout.addStretch()
-        layout.addLayout(color_layout)
+        form.addRow(self.color_label_title, color_layout)
 
         # Brand selection
-        brand_layout = QHBoxLayout()
         self.brand_label_title = QLabel(t("brand_label"))
-        brand_layout.addWidget(self.brand_label_title)
         self.brand_combo = QComboBox()
-        # Load brands initially (without calling on_brand_changed yet)
-        brands = get_all_brands()
-        self.brand_combo.addItems(brands)
+        # Brands are loaded in refresh_brands() once the dialog is shown
         self.brand_combo.currentTextChanged.connect(self.on_brand_changed)
-        brand_layout.addWidget(self.brand_combo)
-        layout.addLayout(brand_layout)
+        form.addRow(self.brand_label_title, self.brand_combo)
 
         # Filament type selection
-        type_layout = QHBoxLayout()
         self.type_label_title = QLabel(t("filament_type"))
-        type_layout.addWidget(self.type_label_title)
         self.type_combo = QComboBox()
         self.type_combo.addItems(["PLA", "PETG", "ABS", "ASA", "PP", "TPU", "NYLON", "PA", "PC"])
-        type_layout.addWidget(self.type_combo)
-        layout.addLayout(type_layout)
+        form.addRow(self.type_label_title, self.type_combo)
 
         # Checkbox for weight without spool
         self.without_spool_checkbox = QCheckBox(t("without_spool"))
         self.without_spool_checkbox.stateChanged.connect(self.on_spool_checkbox_changed)
-        layout.addWidget(self.without_spool_checkbox)
+        form.addRow(self.without_spool_checkbox)
 
         # Spool weight info
         self.spool_info_label = QLabel()
-        layout.addWidget(self.spool_info_label)
+        form.addRow(self.spool_info_label)
 
         # Weight input
-        weight_layout = QHBoxLayout()
         self.weight_label = QLabel(t("weight_with_spool"))
-        weight_layout.addWidget(self.weight_label)
         self.weight_input = QSpinBox()
         self.weight_input.setRange(1, 10000)
         self.weight_input.setValue(1000)
-        self.weight_input.valueChanged.connect(self.update_net_weight)
-        weight_layout.addWidget(self.weight_input)
-        layout.addLayout(weight_layout)
+        # Coalesce bursts of spinbox changes into one label update
+        self._net_weight_timer = QTimer(self)
+        self._net_weight_timer.setSingleShot(True)
+        self._net_weight_timer.setInterval(50)
+        self._net_weight_timer.timeout.connect(self.update_net_weight)
+        self.weight_input.valueChanged.connect(self._net_weight_timer.start)
+        form.addRow(self.weight_label, self.weight_input)
 
         # Net weight info
         self.net_weight_label = QLabel()
-        layout.addWidget(self.net_weight_label)
-
-        # Initialize display
-        if self.brand_combo.count() > 0:
-            self.on_brand_changed(self.brand_combo.currentText())
+        form.addRow(self.net_weight_label)
 
         # Buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -106,9 +123,11 @@ class AddFilamentDialog(QDialog):
     def refresh_brands(self):
         """Refresh the brands list in combo box."""
         current_brand = self.brand_combo.currentText() if self.brand_combo.count() > 0 else None
-        self.brand_combo.clear()
-        brands = get_all_brands()
-        self.brand_combo.addItems(brands)
+        self._spool_weights = get_brand_spool_weights()
+        brands = list(self._spool_weights)
+        model = _shared_brands_model(brands)
+        if self.brand_combo.model() is not model:
+            self.brand_combo.setModel(model)
         # Restore previous selection if it still exists
         if current_brand and current_brand in brands:
             index = self.brand_combo.findText(current_brand)
@@ -120,19 +139,26 @@ class AddFilamentDialog(QDialog):
                 self.on_brand_changed(self.brand_combo.currentText())
     
     def showEvent(self, event: QEvent):
-        """Handle show event to refresh brands list."""
+        """Handle show event to refresh brands list (after the window is painted)."""
         super().showEvent(event)
-        self.refresh_brands()
+        QTimer.singleShot(0, self.refresh_brands)
+
+    def _apply_color(self, color: QColor):
+        """Show the selected color on the swatch button as a filled icon."""
+        pixmap = QPixmap(self.color_btn.iconSize())
+        pixmap.fill(color)
+        self.color_btn.setIcon(QIcon(pixmap))
 
+    @pyqtSlot()
     def choose_color(self):
         """Open color picker dialog."""
-        from PyQt5.QtWidgets import QColorDialog
         color = QColorDialog.getColor(self.selected_color, self, t("select_color"))
         if color.isValid():
             self.selected_color = color
-            self.color_btn.setStyleSheet(f"background-color: {color.name()};")
+            self._apply_color(color)
             self.color_label.setText(color.name())
 
+    @pyqtSlot(int)
     def on_spool_checkbox_changed(self, state):
         """Handle checkbox state change."""
         self.update_net_weight()
@@ -145,11 +171,13 @@ class AddFilamentDialog(QDialog):
         else:
             self.weight_label.setText(t("weight_with_spool"))
 
+    @pyqtSlot(str)
     def on_brand_changed(self, brand: str):
         """Handle brand selection change."""
         if not brand:
             return
-        spool_weight = get_spool_weight(brand)
+        spool_weight = self._spool_weights.get(brand, 150)
+        self._current_spool_weight = spool_weight
         # Check if checkbox exists before accessing it
         if hasattr(self, 'without_spool_checkbox') and self.without_spool_checkbox.isChecked():
             self.spool_info_label.setText(
@@ -163,6 +191,7 @@ class AddFilamentDialog(QDialog):
         if hasattr(self, 'weight_input'):
             self.update_net_weight()
 
+    @pyqtSlot()
     def update_net_weight(self):
         """Update net weight display."""
         if not hasattr(self, 'brand_combo') or not hasattr(self, 'weight_input'):
@@ -170,7 +199,7 @@ class AddFilamentDialog(QDialog):
         brand = self.brand_combo.currentText()
         if not brand:
             return
-        spool_weight = get_spool_weight(brand)
+        spool_weight = self._current_spool_weight
         total_weight = self.weight_input.value()
 
         if hasattr(self, 'without_spool_checkbox') and self.without_spool_checkbox.isChecked():
@@ -189,22 +218,35 @@ class AddFilamentDialog(QDialog):
                     t("net_weight_warning").format(weight=net_weight)
                 )
 
+    def done(self, result: int):
+        """Detach from the shared brands model so later refills don't reach this closed dialog."""
+        self.brand_combo.blockSignals(True)
+        self.brand_combo.setModel(QStandardItemModel(self.brand_combo))
+        self.brand_combo.blockSignals(False)
+        super().done(result)
+
+    def _show_warning(self, message: str):
+        """Show a validation warning using the dialog's reusable message box."""
+        self._err_box.setWindowTitle(t("error"))
+        self._err_box.setText(message)
+        self._err_box.exec_()
+
+    @pyqtSlot()
     def accept_dialog(self):
         """Validate and accept the dialog."""
         brand = self.brand_combo.currentText()
         if not brand:
-            QMessageBox.warning(self, t("error"), t("brand_required"))
+            self._show_warning(t("brand_required"))
             return
 
         total_weight = self.weight_input.value()
         without_spool = self.without_spool_checkbox.isChecked()
 
         if not without_spool:
-            spool_weight = get_spool_weight(brand)
+            spool_weight = self._spool_weights.get(brand, 150)
             net_weight = total_weight - spool_weight
             if net_weight <= 0:
-                QMessageBox.warning(
-                    self, t("error"),
+                self._show_warning(
                     t("weight_too_small").format(
                         total=total_weight, brand=brand, spool=spool_weight, net=net_weight
                     )
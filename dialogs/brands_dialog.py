@@ -4,12 +4,98 @@ Dialog for managing brands.
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit,
-    QSpinBox, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox
+    QSpinBox, QTableView, QAbstractItemView, QHeaderView, QMessageBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSlot
 
 from utils.db_handler import add_brand, load_brands, update_brand, delete_brand, get_brand_by_id
-from utils.translations import t, register_language_callback
+from utils.translations import t, register_language_callback, get_language
+
+
+class BrandsTableModel(QAbstractTableModel):
+    """Table model over brand dicts (name, spool weight)."""
+
+    COLUMN_COUNT = 2
+    ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable  # Read-only, same for every cell
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._brands = []
+        self._headers = [""] * self.COLUMN_COUNT
+
+    def set_brands(self, brands):
+        """Replace displayed brands."""
+        self.beginResetModel()
+        self._brands = brands
+        self.endResetModel()
+
+    def _row_of(self, brand_id):
+        """Row index of the brand with the given id, or -1."""
+        for row, brand in enumerate(self._brands):
+            if brand.get('id') == brand_id:
+                return row
+        return -1
+
+    def append_brand(self, brand):
+        """Insert a single brand at the end."""
+        row = len(self._brands)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._brands.append(brand)
+        self.endInsertRows()
+
+    def replace_brand(self, brand):
+        """Update the row of an existing brand in place."""
+        row = self._row_of(brand.get('id'))
+        if row < 0:
+            return
+        self._brands[row] = brand
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1))
+
+    def remove_brand(self, brand_id):
+        """Remove a single brand row."""
+        row = self._row_of(brand_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._brands[row]
+        self.endRemoveRows()
+
+    def set_headers(self, headers):
+        """Set translated column headers."""
+        self._headers = headers
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._brands)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def flags(self, index):
+        return self.ITEM_FLAGS
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return self._headers[section]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        brand = self._brands[index.row()]
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return brand['name']
+            return f"{brand['spool_weight']} g"
+        if role == Qt.UserRole:
+            return brand.get('id')
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter | Qt.AlignVCenter
+        return None
 
 
 class BrandsDialog(QDialog):
@@ -19,6 +105,8 @@ class BrandsDialog(QDialog):
         super().__init__(parent)
         self.editing_brand_id = None  # Track which brand is being edited
         self.main_window = None  # Will be set for refreshing calculator
+        self._last_lang = get_language()  # Language the texts were last built for
+        self._err_box = QMessageBox(QMessageBox.Warning, t("error"), "", QMessageBox.Ok, self)  # Reused for warnings
         self.init_ui()
         # Register for language updates
         register_language_callback(self.update_translations)
@@ -59,35 +147,22 @@ class BrandsDialog(QDialog):
         toolbar_layout.addStretch()
         layout.addLayout(toolbar_layout)
 
-        # Brands table
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
+        # Brands table (view over a model, no per-cell items)
+        self.model = BrandsTableModel(self)
+        self.table = QTableView()
+        self.table.setObjectName("dataTable")
+        self.table.setModel(self.model)
         self._update_table_headers()
 
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        
-        # Apply dark styling to table
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1e1e1e;
-                alternate-background-color: #1e1e1e;
-                gridline-color: #333;
-                color: #e0e0e0;
-            }
-            QTableWidget::item {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-                padding: 8px;
-            }
-            QTableWidget::item:selected {
-                background-color: #7c3aed;
-                color: white;
-            }
-        """)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Fixed row height instead of measuring every row after each reset
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(40)
+        # Dark table styling comes from the app stylesheet (QTableView#dataTable)
 
         layout.addWidget(self.table)
 
@@ -128,92 +203,78 @@ class BrandsDialog(QDialog):
 
     def _update_table_headers(self):
         """Update table headers with translated text."""
-        headers = [t("brand"), t("spool_weight")]
-        for i, header_text in enumerate(headers):
-            header_item = QTableWidgetItem(header_text)
-            header_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setHorizontalHeaderItem(i, header_item)
+        self.model.set_headers([t("brand"), t("spool_weight")])
 
     def refresh_table(self):
         """Refresh the brands table."""
-        brands = load_brands()
-        self.table.setRowCount(len(brands))
-
-        for row, brand in enumerate(brands):
-            name_item = QTableWidgetItem(brand['name'])
-            name_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            name_item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            # Store brand ID in item data
-            name_item.setData(Qt.UserRole, brand.get('id'))
-            self.table.setItem(row, 0, name_item)
-
-            weight_item = QTableWidgetItem(f"{brand['spool_weight']} g")
-            weight_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            weight_item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            self.table.setItem(row, 1, weight_item)
-
-        self.table.resizeRowsToContents()
+        self.model.set_brands(load_brands())
     
     def get_selected_brand_id(self):
         """Get ID of selected brand."""
         selected_rows = self.table.selectionModel().selectedRows()
         if not selected_rows:
             return None
-        row = selected_rows[0].row()
-        name_item = self.table.item(row, 0)
-        if name_item:
-            return name_item.data(Qt.UserRole)
-        return None
+        # Brand ID is exposed under Qt.UserRole
+        return selected_rows[0].data(Qt.UserRole)
+
+    def _show_warning(self, message: str):
+        """Show a validation warning using the dialog's reusable message box."""
+        self._err_box.setWindowTitle(t("error"))
+        self._err_box.setText(message)
+        self._err_box.exec_()
 
+    @pyqtSlot()
     def add_brand(self):
         """Add a new brand or update existing one."""
         name = self.name_input.text().strip()
 
         if not name:
-            QMessageBox.warning(self, t("error"), t("brand_name_required"))
+            self._show_warning(t("brand_name_required"))
             return
 
         try:
             if self.editing_brand_id:
                 # Update existing brand
-                update_brand(
+                brand = update_brand(
                     brand_id=self.editing_brand_id,
                     name=name,
                     spool_weight=self.weight_input.value()
                 )
                 QMessageBox.information(self, t("success"), t("brand_updated").format(name=name))
+                self.model.replace_brand(brand)
                 self.editing_brand_id = None
                 self.add_btn.setText(t("add_btn"))
                 self.add_section_label.setText(t("add_new_brand"))
             else:
                 # Add new brand
-                add_brand(name=name, spool_weight=self.weight_input.value())
+                brand = add_brand(name=name, spool_weight=self.weight_input.value())
                 QMessageBox.information(self, t("success"), t("brand_added").format(name=name))
+                self.model.append_brand(brand)
                 # Refresh calculator tab filament list (brands may be needed for filament creation)
                 if self.main_window:
                     self.main_window.refresh_calculator_filaments()
             
             self.name_input.clear()
             self.weight_input.setValue(150)
-            self.refresh_table()
         except ValueError as e:
-            QMessageBox.warning(self, t("error"), str(e))
+            self._show_warning(str(e))
         except Exception as e:
             if self.editing_brand_id:
                 QMessageBox.critical(self, t("error"), t("update_brand_error").format(error=str(e)))
             else:
                 QMessageBox.critical(self, t("error"), t("add_brand_error").format(error=str(e)))
     
+    @pyqtSlot()
     def edit_brand(self):
         """Edit selected brand."""
         brand_id = self.get_selected_brand_id()
         if not brand_id:
-            QMessageBox.warning(self, t("error"), t("select_brand_to_edit"))
+            self._show_warning(t("select_brand_to_edit"))
             return
         
         brand = get_brand_by_id(brand_id)
         if not brand:
-            QMessageBox.warning(self, t("error"), "Brand not found.")
+            self._show_warning("Brand not found.")
             return
         
         # Load brand data into form
@@ -226,16 +287,17 @@ class BrandsDialog(QDialog):
         # Scroll to input fields
         self.name_input.setFocus()
     
+    @pyqtSlot()
     def delete_brand(self):
         """Delete selected brand."""
         brand_id = self.get_selected_brand_id()
         if not brand_id:
-            QMessageBox.warning(self, t("error"), t("select_brand_to_delete"))
+            self._show_warning(t("select_brand_to_delete"))
             return
         
         brand = get_brand_by_id(brand_id)
         if not brand:
-            QMessageBox.warning(self, t("error"), "Brand not found.")
+            self._show_warning("Brand not found.")
             return
         
         brand_name = brand['name']
@@ -260,16 +322,20 @@ class BrandsDialog(QDialog):
                         self.weight_input.setValue(150)
                         self.add_btn.setText(t("add_btn"))
                         self.add_section_label.setText(t("add_new_brand"))
-                    self.refresh_table()
+                    self.model.remove_brand(brand_id)
                 else:
-                    QMessageBox.warning(self, t("error"), "Failed to delete brand.")
+                    self._show_warning("Failed to delete brand.")
             except ValueError as e:
-                QMessageBox.warning(self, t("error"), str(e))
+                self._show_warning(str(e))
             except Exception as e:
                 QMessageBox.critical(self, t("error"), t("delete_brand_error").format(error=str(e)))
     
     def update_translations(self):
         """Update all UI text after language change."""
+        lang = get_language()
+        if lang == self._last_lang:
+            return  # Texts and headers already match the current language
+        self._last_lang = lang
         self.setWindowTitle(t("brands_title"))
         self.title_label.setText(t("brands_title_full"))
         self._update_table_headers()
@@ -4,9 +4,10 @@ Dialog for editing an existing filament.
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
-    QSpinBox, QCheckBox, QDialogButtonBox, QMessageBox
+    QSpinBox, QCheckBox, QDialogButtonBox, QMessageBox, QColorDialog
 )
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QColor, QIcon, QPixmap
+from PyQt5.QtCore import QSize
 
 from utils.db_handler import get_filament_by_id, update_filament, get_all_brands, get_spool_weight
 from utils.translations import t
@@ -44,7 +45,8 @@ class EditFilamentDialog(QDialog):
         color_layout.addWidget(self.color_label_title)
         self.color_btn = QPushButton()
         self.color_btn.setFixedSize(50, 30)
-        self.color_btn.setStyleSheet(f"background-color: {self.selected_color.name()};")
+        self.color_btn.setIconSize(QSize(40, 20))
+        self._apply_color(self.selected_color)
         self.color_btn.clicked.connect(self.choose_color)
         color_layout.addWidget(self.color_btn)
         self.color_label = QLabel(self.selected_color.name())
@@ -131,13 +133,18 @@ class EditFilamentDialog(QDialog):
         cancel_btn.setText(t("cancel"))
         layout.addWidget(button_box)
 
+    def _apply_color(self, color: QColor):
+        """Show the selected color on the swatch button as a filled icon."""
+        pixmap = QPixmap(self.color_btn.iconSize())
+        pixmap.fill(color)
+        self.color_btn.setIcon(QIcon(pixmap))
+
     def choose_color(self):
         """Open color picker dialog."""
-        from PyQt5.QtWidgets import QColorDialog
         color = QColorDialog.getColor(self.selected_color, self, t("select_color"))
         if color.isValid():
             self.selected_color = color
-            self.color_btn.setStyleSheet(f"background-color: {color.name()};")
+            self._apply_color(color)
             self.color_label.setText(color.name())
 
     def on_spool_checkbox_changed(self, state):
@@ -3,20 +3,49 @@ Dialog for editing an existing print record.
 """
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
-    QSpinBox, QDoubleSpinBox, QLineEdit, QDialogButtonBox, QMessageBox
+    QDialog, QVBoxLayout, QFormLayout, QLabel, QPushButton, QComboBox,
+    QSpinBox, QDoubleSpinBox, QLineEdit, QDialogButtonBox, QMessageBox, QListView
 )
-from PyQt5.QtGui import QIcon, QPixmap, QColor
+from PyQt5.QtCore import Qt, QEvent, QTimer, pyqtSlot, QAbstractListModel, QModelIndex
 
-from utils.db_handler import get_print_by_id, update_print, load_filaments, get_filament_by_id
+from utils.db_handler import get_print_by_id, update_print, load_filaments_for_display
 from utils.translations import t, format_currency, get_currency_symbol
+from utils.color_icons import create_color_icon
 
 
-def create_color_icon(color_hex: str, size: int = 16) -> QIcon:
-    """Create a square color icon from hex color."""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(QColor(color_hex))
-    return QIcon(pixmap)
+# Item data role holding the full filament dict in the filament combo
+FILAMENT_ROLE = Qt.UserRole + 1
+
+
+class FilamentListModel(QAbstractListModel):
+    """List model over filament dicts; icons are built only for rows the view asks for."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filaments = []
+
+    def set_filaments(self, filaments):
+        """Replace displayed filaments (dicts from load_filaments_for_display)."""
+        self.beginResetModel()
+        self._filaments = filaments
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._filaments)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        filament = self._filaments[index.row()]
+        if role == Qt.DisplayRole:
+            return filament['display_text']
+        if role == Qt.DecorationRole:
+            return create_color_icon(filament.get('color', '#888888'))
+        if role == Qt.UserRole:
+            return filament['id']
+        if role == FILAMENT_ROLE:
+            return filament
+        return None
 
 
 class EditPrintDialog(QDialog):
@@ -25,6 +54,8 @@ class EditPrintDialog(QDialog):
     def __init__(self, print_id: str, parent=None):
         super().__init__(parent)
         self.print_id = print_id
+        self._data_loaded = False
+        self._err_box = QMessageBox(QMessageBox.Warning, t("error"), "", QMessageBox.Ok, self)  # Reused for warnings
         self.print_record = get_print_by_id(print_id)
         if not self.print_record:
             QMessageBox.critical(self, t("error"), "Print record not found.")
@@ -44,52 +75,46 @@ class EditPrintDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
         self.setLayout(layout)
 
+        # Coalesce bursts of spinbox changes into one preview update
+        self._price_preview_timer = QTimer(self)
+        self._price_preview_timer.setSingleShot(True)
+        self._price_preview_timer.setInterval(50)
+        self._price_preview_timer.timeout.connect(self.update_price_preview)
+
+        # Label/field rows share one form layout
+        form = QFormLayout()
+        form.setVerticalSpacing(15)
+        layout.addLayout(form)
+
         # Print name
-        name_layout = QHBoxLayout()
-        name_label = QLabel(t("print_name") + ":")
-        name_layout.addWidget(name_label)
         self.name_input = QLineEdit()
         self.name_input.setText(self.print_record.get('print_name', ''))
-        name_layout.addWidget(self.name_input)
-        layout.addLayout(name_layout)
+        form.addRow(t("print_name") + ":", self.name_input)
 
         # Filament selection
-        filament_layout = QHBoxLayout()
-        filament_label = QLabel(t("filament") + ":")
-        filament_layout.addWidget(filament_label)
         self.filament_combo = QComboBox()
-        self._populate_filaments()
-        current_filament_id = self.print_record.get('filament_id')
-        if current_filament_id:
-            for i in range(self.filament_combo.count()):
-                if self.filament_combo.itemData(i) == current_filament_id:
-                    self.filament_combo.setCurrentIndex(i)
-                    break
+        self._filament_model = FilamentListModel(self)
+        filament_view = QListView()
+        filament_view.setUniformItemSizes(True)  # Popup only lays out visible rows
+        self.filament_combo.setView(filament_view)
+        self.filament_combo.setModel(self._filament_model)
+        # Filaments are loaded in _load_data() once the dialog is shown
         self.filament_combo.currentIndexChanged.connect(self.update_available_weight)
-        filament_layout.addWidget(self.filament_combo)
-        layout.addLayout(filament_layout)
+        form.addRow(t("filament") + ":", self.filament_combo)
 
         # Available weight info
         self.available_weight_label = QLabel()
-        self.update_available_weight()
-        layout.addWidget(self.available_weight_label)
+        form.addRow(self.available_weight_label)
 
         # Weight used
-        weight_layout = QHBoxLayout()
-        weight_label = QLabel(t("weight_used") + ":")
-        weight_layout.addWidget(weight_label)
         self.weight_input = QSpinBox()
         self.weight_input.setRange(1, 10000)
         self.weight_input.setValue(self.print_record.get('weight_used', 0))
         self.weight_input.setSuffix(" g")
-        self.weight_input.valueChanged.connect(self.update_price_preview)
-        weight_layout.addWidget(self.weight_input)
-        layout.addLayout(weight_layout)
+        self.weight_input.valueChanged.connect(self._price_preview_timer.start)
+        form.addRow(t("weight_used") + ":", self.weight_input)
 
         # Price
-        price_layout = QHBoxLayout()
-        price_label = QLabel(t("price") + ":")
-        price_layout.addWidget(price_label)
         self.price_input = QDoubleSpinBox()
         self.price_input.setRange(0, 100000)
         self.price_input.setDecimals(2)
@@ -97,14 +122,14 @@ class EditPrintDialog(QDialog):
         if price_value is not None:
             self.price_input.setValue(price_value)
         self.price_input.setSuffix(f" {get_currency_symbol()}")
-        self.price_input.valueChanged.connect(self.update_price_preview)
-        price_layout.addWidget(self.price_input)
-        layout.addLayout(price_layout)
+        self.price_input.valueChanged.connect(self._price_preview_timer.start)
+        form.addRow(t("price") + ":", self.price_input)
 
         # Price preview (converted to current currency)
         self.price_preview_label = QLabel()
+        self.price_preview_label.setStyleSheet("color: #7c3aed; font-weight: 600;")
         self.update_price_preview()
-        layout.addWidget(self.price_preview_label)
+        form.addRow(self.price_preview_label)
 
         # Buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -116,25 +141,36 @@ class EditPrintDialog(QDialog):
         cancel_btn.setText(t("cancel"))
         layout.addWidget(button_box)
 
+    def showEvent(self, event: QEvent):
+        """Load filaments after the dialog has been painted for the first time."""
+        super().showEvent(event)
+        if not self._data_loaded:
+            self._data_loaded = True
+            QTimer.singleShot(0, self._load_data)
+
+    def _load_data(self):
+        """Populate filaments and select the one used by the print."""
+        self.filament_combo.blockSignals(True)
+        self._populate_filaments()
+        current_filament_id = self.print_record.get('filament_id')
+        if current_filament_id:
+            index = self.filament_combo.findData(current_filament_id)
+            if index >= 0:
+                self.filament_combo.setCurrentIndex(index)
+        self.filament_combo.blockSignals(False)
+        self.update_available_weight()
+
     def _populate_filaments(self):
         """Populate filament combo box with available filaments."""
-        filaments = load_filaments()
-        self.filament_combo.clear()
-        
-        for filament in filaments:
-            color_icon = create_color_icon(filament.get('color', '#888888'))
-            filament_type = filament.get('type', '')
-            if filament_type:
-                display_text = f"{filament['brand']} - {filament_type}"
-            else:
-                display_text = filament['brand']
-            self.filament_combo.addItem(color_icon, display_text, filament['id'])
+        # The model keeps whole records (FILAMENT_ROLE) so selection changes need no lookup
+        self._filament_model.set_filaments(load_filaments_for_display())
 
+    @pyqtSlot()
     def update_available_weight(self):
         """Update available weight label."""
         filament_id = self.filament_combo.currentData()
         if filament_id:
-            filament = get_filament_by_id(filament_id)
+            filament = self.filament_combo.currentData(FILAMENT_ROLE)
             if filament:
                 available = filament['current_weight']
                 old_weight = self.print_record.get('weight_used', 0)
@@ -153,37 +189,43 @@ class EditPrintDialog(QDialog):
         else:
             self.available_weight_label.setText("")
 
+    @pyqtSlot()
     def update_price_preview(self):
         """Update price preview label."""
         price = self.price_input.value()
-        if price > 0:
-            formatted = format_currency(price)
-            self.price_preview_label.setText(f"{t('price')}: {formatted}")
-            self.price_preview_label.setStyleSheet("color: #7c3aed; font-weight: 600;")
-        else:
-            self.price_preview_label.setText("")
+        text = f"{t('price')}: {format_currency(price)}" if price > 0 else ""
+        # Unchanged text would still invalidate the label's layout
+        if text != self.price_preview_label.text():
+            self.price_preview_label.setText(text)
+
+    def _show_warning(self, message: str):
+        """Show a validation warning using the dialog's reusable message box."""
+        self._err_box.setWindowTitle(t("error"))
+        self._err_box.setText(message)
+        self._err_box.exec_()
 
+    @pyqtSlot()
     def accept_dialog(self):
         """Validate and accept the dialog."""
         print_name = self.name_input.text().strip()
         if not print_name:
-            QMessageBox.warning(self, t("error"), f"{t('print_name')} is required.")
+            self._show_warning(f"{t('print_name')} is required.")
             return
 
         filament_id = self.filament_combo.currentData()
         if not filament_id:
-            QMessageBox.warning(self, t("error"), f"{t('filament')} is required.")
+            self._show_warning(f"{t('filament')} is required.")
             return
 
         weight_used = self.weight_input.value()
         if weight_used <= 0:
-            QMessageBox.warning(self, t("error"), f"{t('weight_used')} must be greater than 0.")
+            self._show_warning(f"{t('weight_used')} must be greater than 0.")
             return
 
         # Check available weight
-        filament = get_filament_by_id(filament_id)
+        filament = self.filament_combo.currentData(FILAMENT_ROLE)
         if not filament:
-            QMessageBox.warning(self, t("error"), t("filament_not_found"))
+            self._show_warning(t("filament_not_found"))
             return
 
         available_weight = filament['current_weight']
@@ -195,8 +237,7 @@ class EditPrintDialog(QDialog):
             available_weight += old_weight
 
         if available_weight < weight_used:
-            QMessageBox.warning(
-                self, t("error"),
+            self._show_warning(
                 t("not_enough_filament").format(weight=available_weight)
             )
             return
@@ -3,22 +3,136 @@ Dialog displaying print history for a specific filament.
 """
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableView, QAbstractItemView,
     QHeaderView, QDialogButtonBox, QMessageBox, QPushButton
 )
-from PyQt5.QtCore import Qt
-from datetime import datetime
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
+)
 
 from utils.db_handler import get_filament_by_id, get_filament_history, delete_print
 from utils.translations import t
 
 
+# Rich-text filament info header shown above the history table
+_INFO_TEMPLATE = (
+    "<b>{filament_info}</b> {brand}{type_info}<br>"
+    "<b>{color_info}</b> <span style='background-color: {color}; "
+    "padding: 2px 8px; border-radius: 3px;'>{color}</span><br>"
+    "<b>{initial_weight_info}</b> {initial} g{spool_info}<br>"
+    "<b>{current_weight_info}</b> {current} g"
+)
+_INFO_QSS = "padding: 10px; background-color: #1e1e1e; border-radius: 5px;"
+
+
+class HistoryLoaderSignals(QObject):
+    """Signals for HistoryLoader (QRunnable itself cannot emit)."""
+    loaded = pyqtSignal(int, list)  # request id, print records
+
+
+class HistoryLoader(QRunnable):
+    """Reads one filament's print history from storage on a thread-pool worker."""
+
+    def __init__(self, request_id: int, filament_id: str, signals: HistoryLoaderSignals):
+        super().__init__()
+        self.request_id = request_id
+        self.filament_id = filament_id
+        self.signals = signals
+
+    def run(self):
+        self.signals.loaded.emit(self.request_id, get_filament_history(self.filament_id))
+
+
+class FilamentHistoryModel(QAbstractTableModel):
+    """Table model over print records of one filament (date, name, weight)."""
+
+    COLUMN_COUNT = 3
+    ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable  # Read-only, same for every cell
+    PAGE_SIZE = 200  # Rows handed to the view per fetchMore()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._display_rows = []  # (date, name, weight) cell texts of the rows exposed so far
+        self._headers = [""] * self.COLUMN_COUNT
+
+    def set_rows(self, rows):
+        """Replace print records; only the first page is exposed until the view scrolls."""
+        self.beginResetModel()
+        self._rows = rows
+        self._display_rows = []
+        self._append_page()
+        self.endResetModel()
+
+    def _append_page(self):
+        """Pre-format cell texts for the next page of rows."""
+        start = len(self._display_rows)
+        # ISO timestamps already start with YYYY-MM-DDTHH:MM:SS, so slicing replaces strftime
+        self._display_rows.extend(
+            (row['timestamp'].replace('T', ' ', 1)[:19], row['print_name'], str(row['weight_used']))
+            for row in self._rows[start:start + self.PAGE_SIZE]
+        )
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._display_rows) < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        start = len(self._display_rows)
+        end = min(start + self.PAGE_SIZE, len(self._rows)) - 1
+        if end < start:
+            return
+        self.beginInsertRows(QModelIndex(), start, end)
+        self._append_page()
+        self.endInsertRows()
+
+    def set_headers(self, headers):
+        """Set translated column headers."""
+        self._headers = headers
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._display_rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def flags(self, index):
+        return self.ITEM_FLAGS
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return self._headers[section]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self._display_rows[index.row()][column]
+        if role == Qt.TextAlignmentRole and column == 2:
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+
+
 class FilamentHistoryDialog(QDialog):
     """Dialog displaying print history for a specific filament."""
 
     def __init__(self, filament_id: str, parent=None):
         super().__init__(parent)
         self.filament_id = filament_id
+        self.history_data = []
+        self.data_changed = False  # Set when a print is deleted; callers refresh their views
+        self._load_request_id = 0
+        # Unparented so a late worker emit never hits a deleted dialog child
+        self._loader_signals = HistoryLoaderSignals()
+        self._loader_signals.loaded.connect(self._on_history_loaded)
         self.init_ui()
 
     def init_ui(self):
@@ -41,48 +155,25 @@ class FilamentHistoryDialog(QDialog):
         self.setLayout(layout)
 
         # Filament info header
-        spool_weight = filament.get('spool_weight', 0)
-        spool_info = f"<br><b>{t('spool_weight_info_label')}</b> {spool_weight} g" if spool_weight > 0 else ""
-        type_info = f" - {filament_type}" if filament_type else ""
-        info_text = (
-            f"<b>{t('filament_info')}</b> {filament['brand']}{type_info}<br>"
-            f"<b>{t('color_info')}</b> <span style='background-color: {filament['color']}; "
-            f"padding: 2px 8px; border-radius: 3px;'>{filament['color']}</span><br>"
-            f"<b>{t('initial_weight_info')}</b> {filament['initial_weight']} g{spool_info}<br>"
-            f"<b>{t('current_weight_info')}</b> {filament['current_weight']} g"
-        )
-        info_label = QLabel(info_text)
-        info_label.setStyleSheet("padding: 10px; background-color: #1e1e1e; border-radius: 5px;")
-        layout.addWidget(info_label)
+        self.info_label = QLabel(self._build_info_html(filament))
+        self.info_label.setStyleSheet(_INFO_QSS)
+        layout.addWidget(self.info_label)
 
-        # History table
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
+        # History table (view over a model, cells are rendered on demand)
+        self.model = FilamentHistoryModel(self)
+        self.table = QTableView()
+        self.table.setObjectName("dataTable")  # Styled by the app stylesheet
+        self.table.setModel(self.model)
         self._update_table_headers()
 
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        
-        # Apply dark styling to table
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1e1e1e;
-                alternate-background-color: #1e1e1e;
-                gridline-color: #333;
-                color: #e0e0e0;
-            }
-            QTableWidget::item {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-                padding: 8px;
-            }
-            QTableWidget::item:selected {
-                background-color: #7c3aed;
-                color: white;
-            }
-        """)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Fixed row height instead of measuring every row
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(40)
 
         layout.addWidget(self.table)
 
@@ -107,34 +198,21 @@ class FilamentHistoryDialog(QDialog):
 
     def _update_table_headers(self):
         """Update table headers with translated text."""
-        headers = [t("date"), t("print_name"), t("weight_used")]
-        for i, header_text in enumerate(headers):
-            header_item = QTableWidgetItem(header_text)
-            header_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setHorizontalHeaderItem(i, header_item)
+        self.model.set_headers([t("date"), t("print_name"), t("weight_used")])
 
     def load_history(self):
-        """Load and display print history."""
-        self.history_data = get_filament_history(self.filament_id)
-        self.table.setRowCount(len(self.history_data))
-
-        for row, print_record in enumerate(self.history_data):
-            timestamp = datetime.fromisoformat(print_record['timestamp'])
-            date_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            date_item = QTableWidgetItem(date_str)
-            date_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            self.table.setItem(row, 0, date_item)
-
-            name_item = QTableWidgetItem(print_record['print_name'])
-            name_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            self.table.setItem(row, 1, name_item)
-
-            weight_item = QTableWidgetItem(str(print_record['weight_used']))
-            weight_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            weight_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row, 2, weight_item)
+        """Start loading print history in the background; the table fills in when it arrives."""
+        self._load_request_id += 1
+        QThreadPool.globalInstance().start(
+            HistoryLoader(self._load_request_id, self.filament_id, self._loader_signals)
+        )
 
-        self.table.resizeRowsToContents()
+    def _on_history_loaded(self, request_id: int, history: list):
+        """Apply loaded history unless a newer load has been requested meanwhile."""
+        if request_id != self._load_request_id:
+            return
+        self.history_data = history
+        self.model.set_rows(self.history_data)
 
     def delete_selected_print(self):
         """Delete the selected print record and restore weight to filament."""
@@ -169,6 +247,7 @@ class FilamentHistoryDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             if delete_print(print_id, restore_weight=True):
+                self.data_changed = True
                 QMessageBox.information(self, t("success"), t("print_deleted"))
                 self.load_history()
                 # Update filament info
@@ -176,25 +255,25 @@ class FilamentHistoryDialog(QDialog):
             else:
                 QMessageBox.warning(self, t("error"), t("delete_failed"))
 
+    def _build_info_html(self, filament) -> str:
+        """Build the rich-text filament info header."""
+        spool_weight = filament.get('spool_weight', 0)
+        filament_type = filament.get('type', '')
+        return _INFO_TEMPLATE.format_map({
+            "filament_info": t('filament_info'),
+            "brand": filament['brand'],
+            "type_info": f" - {filament_type}" if filament_type else "",
+            "color_info": t('color_info'),
+            "color": filament['color'],
+            "initial_weight_info": t('initial_weight_info'),
+            "initial": filament['initial_weight'],
+            "spool_info": f"<br><b>{t('spool_weight_info_label')}</b> {spool_weight} g" if spool_weight > 0 else "",
+            "current_weight_info": t('current_weight_info'),
+            "current": filament['current_weight'],
+        })
+
     def _refresh_filament_info(self):
         """Refresh the filament info label after weight change."""
         filament = get_filament_by_id(self.filament_id)
         if filament:
-            spool_weight = filament.get('spool_weight', 0)
-            spool_info = f"<br><b>{t('spool_weight_info_label')}</b> {spool_weight} g" if spool_weight > 0 else ""
-            filament_type = filament.get('type', '')
-            type_info = f" - {filament_type}" if filament_type else ""
-            info_text = (
-                f"<b>{t('filament_info')}</b> {filament['brand']}{type_info}<br>"
-                f"<b>{t('color_info')}</b> <span style='background-color: {filament['color']}; "
-                f"padding: 2px 8px; border-radius: 3px;'>{filament['color']}</span><br>"
-                f"<b>{t('initial_weight_info')}</b> {filament['initial_weight']} g{spool_info}<br>"
-                f"<b>{t('current_weight_info')}</b> {filament['current_weight']} g"
-            )
-            # Find and update the info label
-            layout = self.layout()
-            for i in range(layout.count()):
-                widget = layout.itemAt(i).widget()
-                if isinstance(widget, QLabel) and t('filament_info') in widget.text():
-                    widget.setText(info_text)
-                    break
+            self.info_label.setText(self._build_info_html(filament))
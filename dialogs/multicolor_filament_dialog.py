@@ -7,18 +7,35 @@ from PyQt5.QtWidgets import (
     QPushButton, QFormLayout, QMessageBox, QGroupBox
 )
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from collections import defaultdict
 from typing import List, Dict, Optional
 
-from utils.db_handler import load_filaments, get_filament_by_id
+from utils.db_handler import load_filaments
 from utils.translations import t, register_language_callback
+from utils.color_icons import create_color_icon
 
 
-def create_color_icon(color_hex: str, size: int = 16):
-    """Create a square color icon from hex color."""
-    from PyQt5.QtGui import QIcon, QPixmap, QColor
-    pixmap = QPixmap(size, size)
-    pixmap.fill(QColor(color_hex))
-    return QIcon(pixmap)
+# Minimum widths of the per-weight filament combos and their popups
+COMBO_MIN_WIDTH = 300
+COMBO_POPUP_MIN_WIDTH = 350
+
+# Per-file group boxes (QGroupBox#fileGroup)
+_GROUPBOX_QSS = """
+    QGroupBox#fileGroup {
+        border: 1px solid #3a3a3a;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 12px;
+        font-weight: 600;
+        font-size: 12px;
+    }
+    QGroupBox#fileGroup::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px;
+    }
+"""
 
 
 class MulticolorFilamentDialog(QDialog):
@@ -37,6 +54,7 @@ class MulticolorFilamentDialog(QDialog):
         self.selected_filaments = []
         self.file_filament_mapping = {}  # Dict mapping filename -> list of filament selections
         self.combos = []  # List of lists: one list per file, containing combos for each weight
+        self._form_labels = []  # (QLabel, weight number or None for single-weight files, weight)
         self.init_ui()
 
     def init_ui(self):
@@ -44,6 +62,8 @@ class MulticolorFilamentDialog(QDialog):
         self.setWindowTitle(t("select_filaments_multicolor"))
         self.setModal(True)
         self.setMinimumWidth(600)
+        # Parsed once for all per-file group boxes
+        self.setStyleSheet(_GROUPBOX_QSS)
         
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
@@ -51,12 +71,29 @@ class MulticolorFilamentDialog(QDialog):
         
         # Info label
         total_weights = sum(len(fd['weights']) for fd in self.file_data_list)
-        info_label = QLabel(t("multicolor_info").format(count=total_weights))
-        info_label.setWordWrap(True)
-        layout.addWidget(info_label)
+        self.info_label = QLabel(t("multicolor_info").format(count=total_weights))
+        self.info_label.setWordWrap(True)
+        layout.addWidget(self.info_label)
         
         filaments = load_filaments()
         
+        # One filament model shared by every weight combo (each combo keeps its own selection)
+        self.filament_model = QStandardItemModel(self)
+        self.filament_model.appendRow(QStandardItem(t("select_filament")))
+        for filament in filaments:
+            filament_type = filament.get('type', '')
+            if filament_type:
+                display_text = f"{filament['brand']} - {filament_type} ({filament['current_weight']}g)"
+            else:
+                display_text = f"{filament['brand']} ({filament['current_weight']}g)"
+            item = QStandardItem(create_color_icon(filament['color']), display_text)
+            item.setData(filament['id'], Qt.UserRole)
+            self.filament_model.appendRow(item)
+        
+        # Row label templates, looked up once for all weights
+        label_multi = t("filament_weight_label")
+        label_single = t("filament_weight_label_single")
+        
         # Create group for each file
         for file_data in self.file_data_list:
             filename = file_data['filename']
@@ -64,21 +101,7 @@ class MulticolorFilamentDialog(QDialog):
             
             # Group box for this file
             file_group = QGroupBox(filename)
-            file_group.setStyleSheet("""
-                QGroupBox {
-                    border: 1px solid #3a3a3a;
-                    border-radius: 8px;
-                    margin-top: 12px;
-                    padding-top: 12px;
-                    font-weight: 600;
-                    font-size: 12px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 12px;
-                    padding: 0 8px;
-                }
-            """)
+            file_group.setObjectName("fileGroup")  # Styled by the dialog stylesheet
             file_layout = QVBoxLayout(file_group)
             file_layout.setSpacing(10)
             file_layout.setContentsMargins(16, 20, 16, 16)
@@ -90,29 +113,19 @@ class MulticolorFilamentDialog(QDialog):
             file_combos = []  # Combos for this file
             
             for i, weight in enumerate(weights):
-                if len(weights) > 1:
-                    label_text = t("filament_weight_label").format(num=i+1, weight=f"{weight:.2f}")
+                num = i + 1 if len(weights) > 1 else None
+                if num is not None:
+                    label_text = label_multi.format(num=num, weight=f"{weight:.2f}")
                 else:
-                    label_text = t("filament_weight_label_single").format(weight=f"{weight:.2f}")
+                    label_text = label_single.format(weight=f"{weight:.2f}")
                 
                 label = QLabel(label_text)
+                self._form_labels.append((label, num, weight))
                 combo = QComboBox()
-                combo.setMinimumWidth(300)
-                combo.view().setMinimumWidth(350)
-                
-                # Add "Select filament" option
-                combo.addItem(t("select_filament"), None)
-                
-                # Add available filaments
-                for filament in filaments:
-                    filament_type = filament.get('type', '')
-                    if filament_type:
-                        display_text = f"{filament['brand']} - {filament_type} ({filament['current_weight']}g)"
-                    else:
-                        display_text = f"{filament['brand']} ({filament['current_weight']}g)"
-                    
-                    color_icon = create_color_icon(filament['color'])
-                    combo.addItem(color_icon, display_text, filament['id'])
+                combo.setMinimumWidth(COMBO_MIN_WIDTH)
+                combo.view().setMinimumWidth(COMBO_POPUP_MIN_WIDTH)
+                # "Select filament" placeholder followed by available filaments
+                combo.setModel(self.filament_model)
                 
                 form_layout.addRow(label, combo)
                 file_combos.append(combo)
@@ -125,28 +138,27 @@ class MulticolorFilamentDialog(QDialog):
         buttons_layout = QHBoxLayout()
         buttons_layout.addStretch()
         
-        cancel_button = QPushButton(t("cancel"))
-        cancel_button.clicked.connect(self.reject)
-        buttons_layout.addWidget(cancel_button)
+        self.cancel_button = QPushButton(t("cancel"))
+        self.cancel_button.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.cancel_button)
         
-        ok_button = QPushButton(t("ok"))
-        ok_button.clicked.connect(self.accept_selection)
-        buttons_layout.addWidget(ok_button)
+        self.ok_button = QPushButton(t("ok"))
+        self.ok_button.clicked.connect(self.accept_selection)
+        buttons_layout.addWidget(self.ok_button)
         
         layout.addLayout(buttons_layout)
 
     def accept_selection(self):
         """Validate and accept the selection."""
-        self.selected_filaments = []
-        self.file_filament_mapping = {}  # Dict mapping filename -> list of filament selections
-        
-        weight_index = 0  # Global index across all files
+        filament_cache = {f['id']: f for f in load_filaments()}
         
+        # First pass: every weight needs a known filament; sum grams required per filament
+        selections = []  # (filename, weight, filament_id) in display order
+        required = defaultdict(float)
         for file_idx, file_data in enumerate(self.file_data_list):
             filename = file_data['filename']
             weights = file_data['weights']
             file_combos = self.combos[file_idx]
-            file_filaments = []  # Filaments for this specific file
             
             for weight_idx, (weight, combo) in enumerate(zip(weights, file_combos)):
                 filament_id = combo.currentData()
@@ -160,40 +172,36 @@ class MulticolorFilamentDialog(QDialog):
                     QMessageBox.warning(self, t("validation_error"), error_msg)
                     return
                 
-                filament = get_filament_by_id(filament_id)
-                if not filament:
+                if filament_id not in filament_cache:
                     QMessageBox.warning(self, t("error"), t("filament_not_found"))
                     return
                 
-                # Check if enough weight available
-                if filament['current_weight'] < weight:
-                    if len(weights) > 1:
-                        error_msg = t("not_enough_filament_for_weight").format(
-                            num=weight_idx+1,
-                            weight=f"{weight:.2f}",
-                            available=filament['current_weight'],
-                            brand=filament['brand']
-                        )
-                    else:
-                        error_msg = t("not_enough_filament_for_weight_single").format(
-                            weight=f"{weight:.2f}",
-                            available=filament['current_weight'],
-                            brand=filament['brand']
-                        )
-                    QMessageBox.warning(self, t("insufficient_filament"), error_msg)
-                    return
-                
-                filament_item = {
-                    'filament_id': filament_id,
-                    'weight': weight,
-                    'filament': filament
-                }
-                self.selected_filaments.append(filament_item)
-                file_filaments.append(filament_item)  # Add to file-specific list
-                weight_index += 1
-            
-            # Store mapping for this file
-            self.file_filament_mapping[filename] = file_filaments
+                required[filament_id] += weight
+                selections.append((filename, weight, filament_id))
+        
+        # Second pass: one check per filament against everything assigned to it
+        for filament_id, needed in required.items():
+            filament = filament_cache[filament_id]
+            if filament['current_weight'] < needed:
+                error_msg = t("not_enough_filament_for_weight_single").format(
+                    weight=f"{needed:.2f}",
+                    available=filament['current_weight'],
+                    brand=filament['brand']
+                )
+                QMessageBox.warning(self, t("insufficient_filament"), error_msg)
+                return
+        
+        self.selected_filaments = []
+        # Dict mapping filename -> list of filament selections
+        self.file_filament_mapping = {fd['filename']: [] for fd in self.file_data_list}
+        for filename, weight, filament_id in selections:
+            filament_item = {
+                'filament_id': filament_id,
+                'weight': weight,
+                'filament': filament_cache[filament_id]
+            }
+            self.selected_filaments.append(filament_item)
+            self.file_filament_mapping[filename].append(filament_item)  # Add to file-specific list
         
         self.accept()
 
@@ -211,8 +219,19 @@ class MulticolorFilamentDialog(QDialog):
     def update_translations(self):
         """Update all UI text after language change."""
         self.setWindowTitle(t("select_filaments_multicolor"))
-        # Note: Form labels would need to be updated, but they're created dynamically
-        # This is acceptable as the dialog is typically shown once per file load
+        total_weights = sum(len(fd['weights']) for fd in self.file_data_list)
+        self.info_label.setText(t("multicolor_info").format(count=total_weights))
+        # Placeholder lives in the shared model, so every combo picks it up
+        self.filament_model.item(0).setText(t("select_filament"))
+        label_multi = t("filament_weight_label")
+        label_single = t("filament_weight_label_single")
+        for label, num, weight in self._form_labels:
+            if num is not None:
+                label.setText(label_multi.format(num=num, weight=f"{weight:.2f}"))
+            else:
+                label.setText(label_single.format(weight=f"{weight:.2f}"))
+        self.cancel_button.setText(t("cancel"))
+        self.ok_button.setText(t("ok"))
 
 
 
@@ -10,16 +10,21 @@ from PyQt5.QtWidgets import (
     QSpinBox, QSizePolicy, QListWidget, QListWidgetItem, QDialog, QDialogButtonBox,
     QFrame, QScrollArea, QCheckBox
 )
-from PyQt5.QtCore import Qt, QMimeData
-from PyQt5.QtGui import QFont, QDragEnterEvent, QDropEvent, QColor, QBrush, QPixmap, QIcon, QPainter
+from PyQt5.QtCore import Qt, QMimeData, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QFont, QDragEnterEvent, QDropEvent, QColor
 
 from utils.db_handler import load_filaments, get_filament_by_id, add_print
 from utils.gcode_parser import GCodeParser
 from utils.price_calculator import PriceCalculator
 from utils.translations import t, register_language_callback, format_currency, register_currency_callback
+from utils.color_icons import create_color_icon
 from dialogs.multicolor_filament_dialog import MulticolorFilamentDialog
 
 
+# File extensions accepted as G-code
+GCODE_EXTENSIONS = ('.gcode', '.gco', '.nc', '.bgcode')
+
+
 class DragDropListWidget(QListWidget):
     """List widget with drag and drop support for G-code files."""
 
@@ -28,15 +33,35 @@ class DragDropListWidget(QListWidget):
         self.setAcceptDrops(True)
         self.setDragDropMode(QListWidget.DropOnly)
         self.setSelectionMode(QListWidget.ExtendedSelection)
+        # Paths currently in the list, for O(1) duplicate checks
+        self._paths = set()
+        self.model().rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+
+    def add_gcode_file(self, file_path: str) -> bool:
+        """Add file to the list unless already present. Returns True if added."""
+        if file_path in self._paths:
+            return False
+        item = QListWidgetItem(os.path.basename(file_path))
+        item.setData(Qt.UserRole, file_path)
+        self.addItem(item)
+        self._paths.add(file_path)
+        return True
+
+    def clear(self):
+        """Remove all items (and their tracked paths)."""
+        super().clear()
+        self._paths.clear()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        """Forget paths of rows being removed."""
+        for row in range(first, last + 1):
+            self._paths.discard(self.item(row).data(Qt.UserRole))
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event."""
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
-            gcode_files = [url for url in urls if url.toLocalFile().lower().endswith(
-                ('.gcode', '.gco', '.nc', '.bgcode')
-            )]
-            if gcode_files:
+            if any(url.toLocalFile().lower().endswith(GCODE_EXTENSIONS) for url in urls):
                 event.acceptProposedAction()
 
     def dragMoveEvent(self, event):
@@ -50,35 +75,34 @@ class DragDropListWidget(QListWidget):
             urls = event.mimeData().urls()
             for url in urls:
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.gcode', '.gco', '.nc', '.bgcode')):
-                    if not any(self.item(i).data(Qt.UserRole) == file_path 
-                             for i in range(self.count())):
-                        item = QListWidgetItem(os.path.basename(file_path))
-                        item.setData(Qt.UserRole, file_path)
-                        self.addItem(item)
+                if file_path.lower().endswith(GCODE_EXTENSIONS):
+                    self.add_gcode_file(file_path)
             event.acceptProposedAction()
 
 
-def create_color_icon(color_str: str, size: int = 20) -> QIcon:
-    """Create a colored square icon for combo boxes."""
-    if not color_str.startswith('#'):
-        color_str = '#' + color_str
-    color = QColor(color_str)
-    if not color.isValid():
-        color = QColor("#000000")
-    
-    pixmap = QPixmap(size, size)
-    pixmap.fill(QColor(0, 0, 0, 0))
-    
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-    painter.setBrush(QBrush(color))
-    painter.setPen(QColor(0, 0, 0, 0))
-    margin = 2
-    painter.drawRect(margin, margin, size - 2 * margin, size - 2 * margin)
-    painter.end()
-    
-    return QIcon(pixmap)
+class GCodeParseSignals(QObject):
+    """Signals for GCodeParseJob (QRunnable itself cannot emit)."""
+    parsed = pyqtSignal(list, list)  # file paths, parse results (same order)
+
+
+class GCodeParseJob(QRunnable):
+    """Parses a batch of G-code files on a thread-pool worker and reports once."""
+
+    def __init__(self, file_paths: list, signals: GCodeParseSignals):
+        super().__init__()
+        self.file_paths = file_paths
+        self.signals = signals
+
+    def run(self):
+        results = []
+        for file_path in self.file_paths:
+            # A file that fails to parse must not stop the batch: parsed is always emitted
+            try:
+                results.append(GCodeParser.parse_gcode(file_path))
+            except Exception as e:
+                print(f"Error parsing G-code {file_path}: {e}")
+                results.append({"time_hours": 0.0, "filament_weight_g": 0.0, "material_type": ""})
+        self.signals.parsed.emit(self.file_paths, results)
 
 
 class MulticolorDisplayWidget(QWidget):
@@ -244,12 +268,19 @@ class CalculatorTab(QWidget):
     def __init__(self, config: Dict, parent=None):
         super().__init__(parent)
         self.config = config
+        self.main_window = None  # Will be set by MainWindow
         self.current_filament_id = None
         self.current_multicolor_filaments = []  # List of {filament_id, weight, filename} for multicolor
         self.file_filament_mapping = {}  # Dict mapping filename -> list of filament selections for that file
         self.current_price_result = None
+        self._gcode_parse_signals = GCodeParseSignals(self)
+        self._gcode_parse_signals.parsed.connect(self._on_gcode_files_parsed)
         self.init_ui()
 
+    def set_main_window(self, main_window):
+        """Set reference to main window for marking other tabs dirty."""
+        self.main_window = main_window
+
     def _create_cost_row(self, label_widget: QLabel, value_widget: QLabel, accent_color: str) -> QWidget:
         """Create a styled cost row with label and value."""
         row = QWidget()
@@ -691,7 +722,7 @@ class CalculatorTab(QWidget):
             else:
                 display_text = f"{filament['brand']} ({filament['current_weight']}g)"
 
-            color_icon = create_color_icon(filament['color'])
+            color_icon = create_color_icon(filament['color'], 20, inset=2)
             self.filament_combo.addItem(color_icon, display_text, filament['id'])
         
         # Restore combo box state based on current selection
@@ -752,11 +783,7 @@ class CalculatorTab(QWidget):
 
         if file_paths:
             for file_path in file_paths:
-                if not any(self.gcode_list.item(i).data(Qt.UserRole) == file_path
-                         for i in range(self.gcode_list.count())):
-                    item = QListWidgetItem(os.path.basename(file_path))
-                    item.setData(Qt.UserRole, file_path)
-                    self.gcode_list.addItem(item)
+                self.gcode_list.add_gcode_file(file_path)
             
             # Update checkbox state - enable if multiple files
             self._update_save_separately_checkbox()
@@ -816,6 +843,14 @@ class CalculatorTab(QWidget):
             QMessageBox.warning(self, t("import_gcode"), t("no_files_found"))
             return
 
+        # Parse off the GUI thread; results arrive in one batch
+        self.load_button.setEnabled(False)
+        QThreadPool.globalInstance().start(GCodeParseJob(file_paths, self._gcode_parse_signals))
+
+    def _on_gcode_files_parsed(self, file_paths: list, results: list):
+        """Apply parsed G-code data from all loaded files."""
+        self.load_button.setEnabled(True)
+
         total_time = 0.0
         total_filament = 0.0
         materials_found = []
@@ -823,8 +858,7 @@ class CalculatorTab(QWidget):
         file_data_list = []  # List of {filename, weights} for each file
         has_multicolor = False  # Track if any file has multicolor
 
-        for file_path in file_paths:
-            result = GCodeParser.parse_gcode(file_path)
+        for file_path, result in zip(file_paths, results):
             file_time = result.get("time_hours", 0.0)
             file_filament = result.get("filament_weight_g", 0.0)
             file_material = result.get("material_type", "")
@@ -1431,6 +1465,10 @@ class CalculatorTab(QWidget):
                         )
                     )
 
+            # Inventory weights and history changed
+            if self.main_window:
+                self.main_window.mark_dirty(1, 2)
+
             # Refresh filament list and clear inputs
             self.load_filaments()
             self.filament_weight_input.clear()
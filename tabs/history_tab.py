@@ -3,23 +3,130 @@ History tab for viewing all print records with filtering and summaries.
 """
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, 
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QHeaderView, QPushButton, QMessageBox, QComboBox, QLabel, QDateEdit,
     QCheckBox, QCalendarWidget, QDialog
 )
-from PyQt5.QtCore import Qt, QDate, QLocale, QEvent, QTimer
-from PyQt5.QtGui import QIcon, QPixmap, QColor
+from PyQt5.QtCore import (
+    Qt, QDate, QLocale, QEvent, QTimer, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, pyqtSignal
+)
 from datetime import datetime, timedelta
 
-from utils.db_handler import get_all_prints, get_filament_by_id, delete_print, load_filaments
+from utils.db_handler import get_all_prints, delete_print, load_filaments
 from utils.translations import t, format_currency
+from utils.color_icons import create_color_icon
+
+
+class PrintsLoaderSignals(QObject):
+    """Signals for PrintsLoader (QRunnable itself cannot emit)."""
+    loaded = pyqtSignal(int, list, list)  # request id, prints, filaments
+
+
+class PrintsLoader(QRunnable):
+    """Reads prints and filaments from storage on a thread-pool worker."""
+
+    def __init__(self, request_id: int, signals: PrintsLoaderSignals):
+        super().__init__()
+        self.request_id = request_id
+        self.signals = signals
+
+    def run(self):
+        prints = get_all_prints()
+        filaments = load_filaments()
+        self.signals.loaded.emit(self.request_id, prints, filaments)
+
+
+class PrintsModel(QAbstractTableModel):
+    """Table model over print records; cell texts are pre-formatted once per set_prints()."""
+
+    COLUMN_COUNT = 5
+    ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable  # Read-only, same for every cell
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._display_rows = []  # (date, filament, name, weight, icon) per row; price stays in data()
+        self._headers = [""] * self.COLUMN_COUNT
+
+    def set_prints(self, prints, filaments_by_id):
+        """Replace displayed prints (filaments_by_id maps id -> filament dict)."""
+        self.beginResetModel()
+        self._rows = prints
+        self._display_rows = [self._format_row(p, filaments_by_id) for p in prints]
+        self.endResetModel()
+
+    @staticmethod
+    def _format_row(print_record, filaments_by_id):
+        """Build the static cell texts and icon of one print record."""
+        timestamp = datetime.fromisoformat(print_record['timestamp'])
+        filament = filaments_by_id.get(print_record.get('filament_id'))
+        if not filament:
+            filament_text = "Unknown"
+            color = "#888888"
+        else:
+            filament_type = filament.get('type', '')
+            if filament_type:
+                filament_text = f"{filament['brand']} - {filament_type}"
+            else:
+                filament_text = filament['brand']
+            color = filament.get('color', '#888888')
+        return (
+            timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            filament_text,
+            print_record.get('print_name', 'N/A'),
+            f"{print_record.get('weight_used', 0)}",
+            create_color_icon(color)
+        )
+
+    def set_headers(self, headers):
+        """Set translated column headers."""
+        self._headers = headers
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def refresh_prices(self):
+        """Re-render the price column (formatted in data()) after a currency change."""
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 4), self.index(len(self._rows) - 1, 4), [Qt.DisplayRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def flags(self, index):
+        return self.ITEM_FLAGS
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return self._headers[section]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
 
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
 
-def create_color_icon(color_hex: str, size: int = 16) -> QIcon:
-    """Create a square color icon from hex color."""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(QColor(color_hex))
-    return QIcon(pixmap)
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.DecorationRole:
+            return self._display_rows[row][4] if column == 1 else None
+        if role != Qt.DisplayRole:
+            return None
+
+        if column == 4:
+            # Formatted here so refresh_prices() can re-render after a currency change
+            price = self._rows[row].get('price')
+            return format_currency(price) if price is not None else "-"
+        # Columns 0-3 line up with the pre-formatted tuple
+        return self._display_rows[row][column]
 
 
 class HistoryTab(QWidget):
@@ -27,10 +134,21 @@ class HistoryTab(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.main_window = None  # Will be set by MainWindow
         self.all_prints = []
         self.filtered_prints = []
+        self._total_price = 0.0  # Summary in PLN, re-formatted on currency change
+        self.filaments_by_id = {}
+        # Background loading; only the newest request's result is applied
+        self._load_request_id = 0
+        self._loader_signals = PrintsLoaderSignals(self)
+        self._loader_signals.loaded.connect(self._on_prints_loaded)
         self.init_ui()
 
+    def set_main_window(self, main_window):
+        """Set reference to main window for marking other tabs dirty."""
+        self.main_window = main_window
+
     def init_ui(self):
         """Initialize the history tab UI."""
         layout = QVBoxLayout(self)
@@ -109,9 +227,11 @@ class HistoryTab(QWidget):
         
         layout.addLayout(toolbar)
 
-        # Table widget
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
+        # Table view backed by a model (no per-cell items)
+        self.model = PrintsModel(self)
+        self.table = QTableView()
+        self.table.setObjectName("dataTable")
+        self.table.setModel(self.model)
         self._update_table_headers()
 
         header = self.table.horizontalHeader()
@@ -122,27 +242,11 @@ class HistoryTab(QWidget):
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
 
         self.table.verticalHeader().setVisible(False)
+        # Fixed row height instead of measuring every row after each reset
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(40)
         self.table.setAlternatingRowColors(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        
-        # Apply consistent dark styling to table
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1e1e1e;
-                alternate-background-color: #1e1e1e;
-                gridline-color: #333;
-                color: #e0e0e0;
-            }
-            QTableWidget::item {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-                padding: 8px;
-            }
-            QTableWidget::item:selected {
-                background-color: #7c3aed;
-                color: white;
-            }
-        """)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
 
         layout.addWidget(self.table)
 
@@ -279,11 +383,7 @@ class HistoryTab(QWidget):
 
     def _update_table_headers(self):
         """Update table headers with translated text."""
-        headers = [t("date"), t("filament"), t("print_name"), t("weight_used"), t("price")]
-        for i, header_text in enumerate(headers):
-            header_item = QTableWidgetItem(header_text)
-            header_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setHorizontalHeaderItem(i, header_item)
+        self.model.set_headers([t("date"), t("filament"), t("print_name"), t("weight_used"), t("price")])
 
     def _populate_filters(self):
         """Populate filter dropdowns with available options."""
@@ -307,7 +407,7 @@ class HistoryTab(QWidget):
                 filament_ids.add(fid)
         
         for fid in filament_ids:
-            filament = get_filament_by_id(fid)
+            filament = self.filaments_by_id.get(fid)
             if filament:
                 color_icon = create_color_icon(filament.get('color', '#888888'))
                 filament_type = filament.get('type', '')
@@ -378,77 +478,33 @@ class HistoryTab(QWidget):
         self.date_to.setDate(QDate.currentDate())
 
     def refresh_table(self):
-        """Refresh the history table with current data."""
-        self.all_prints = get_all_prints()
+        """Refresh the history table with current data (loaded off the GUI thread)."""
+        self._load_request_id += 1
+        QThreadPool.globalInstance().start(PrintsLoader(self._load_request_id, self._loader_signals))
+
+    def _on_prints_loaded(self, request_id: int, prints: list, filaments: list):
+        """Apply loaded data unless a newer refresh has been requested meanwhile."""
+        if request_id != self._load_request_id:
+            return
+        self.all_prints = prints
+        self.filaments_by_id = {f['id']: f for f in filaments}
         self._populate_filters()
         self.apply_filters()
 
     def _display_prints(self, prints):
         """Display given prints in the table."""
-        self.table.setRowCount(len(prints))
+        self.model.set_prints(prints, self.filaments_by_id)
         
         total_weight = 0
         total_price = 0.0
-
-        for row, print_record in enumerate(prints):
-            # Date column (centered)
-            timestamp = datetime.fromisoformat(print_record['timestamp'])
-            date_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            date_item = QTableWidgetItem(date_str)
-            date_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            date_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, date_item)
-
-            # Filament column with color icon (centered)
-            filament_id = print_record.get('filament_id')
-            filament_text = "Unknown"
-            filament_color = "#888888"
-            if filament_id:
-                filament = get_filament_by_id(filament_id)
-                if filament:
-                    filament_color = filament.get('color', '#888888')
-                    filament_type = filament.get('type', '')
-                    if filament_type:
-                        filament_text = f"{filament['brand']} - {filament_type}"
-                    else:
-                        filament_text = filament['brand']
-
-            filament_item = QTableWidgetItem(filament_text)
-            filament_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            filament_item.setIcon(create_color_icon(filament_color))
-            filament_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 1, filament_item)
-
-            # Print name column (centered)
-            print_name = print_record.get('print_name', 'N/A')
-            name_item = QTableWidgetItem(print_name)
-            name_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            name_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 2, name_item)
-
-            # Weight used column (centered)
-            weight_used = print_record.get('weight_used', 0)
-            weight_item = QTableWidgetItem(f"{weight_used}")
-            weight_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            weight_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 3, weight_item)
-            total_weight += weight_used
-
-            # Price column (centered)
+        for print_record in prints:
+            total_weight += print_record.get('weight_used', 0)
             price = print_record.get('price')
             if price is not None:
-                price_str = format_currency(price)
                 total_price += price
-            else:
-                price_str = "-"
-            price_item = QTableWidgetItem(price_str)
-            price_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            price_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 4, price_item)
-
-        self.table.resizeRowsToContents()
         
         # Update summary
+        self._total_price = total_price
         self.total_weight_value.setText(f"{total_weight} g")
         self.total_price_value.setText(format_currency(total_price))
 
@@ -472,6 +528,9 @@ class HistoryTab(QWidget):
         dialog = EditPrintDialog(print_id, self)
         if dialog.exec_() == QDialog.Accepted:
             self.refresh_table()
+            # Filament weights changed
+            if self.main_window:
+                self.main_window.mark_dirty(1)
 
     def delete_selected_print(self):
         """Delete the selected print record and restore weight to filament."""
@@ -508,6 +567,9 @@ class HistoryTab(QWidget):
             if delete_print(print_id, restore_weight=True):
                 QMessageBox.information(self, t("success"), t("print_deleted"))
                 self.refresh_table()
+                # Restored weight changes the inventory
+                if self.main_window:
+                    self.main_window.mark_dirty(1)
             else:
                 QMessageBox.warning(self, t("error"), t("delete_failed"))
 
@@ -533,4 +595,6 @@ class HistoryTab(QWidget):
 
     def update_currency(self):
         """Update displayed prices after currency change."""
-        self.apply_filters()
+        # Prices are stored in PLN and formatted on display; no reload needed
+        self.model.refresh_prices()
+        self.total_price_value.setText(format_currency(self._total_price))
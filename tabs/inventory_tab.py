@@ -24,6 +24,16 @@ class InventoryTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = None  # Will be set by MainWindow
+        # Cell prototypes; clone() copies flags, alignment and font in one call
+        self._cell_proto = QTableWidgetItem()
+        self._cell_proto.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        self._cell_proto.setTextAlignment(Qt.AlignCenter)
+        font = self._cell_proto.font()
+        font.setPointSize(12)
+        self._cell_proto.setFont(font)
+        self._bold_cell_proto = self._cell_proto.clone()
+        font.setBold(True)
+        self._bold_cell_proto.setFont(font)
         self.init_ui()
     
     def set_main_window(self, main_window):
@@ -89,28 +99,13 @@ class InventoryTab(QWidget):
         self.table.setColumnWidth(0, 100)
 
         self.table.verticalHeader().setVisible(False)
+        # Fixed row height instead of measuring every row after each refresh
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(40)
         self.table.setAlternatingRowColors(False)
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
         self.table.setSelectionMode(QTableWidget.SingleSelection)
-        
-        # Apply consistent dark styling to table
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1e1e1e;
-                alternate-background-color: #1e1e1e;
-                gridline-color: #333;
-                color: #e0e0e0;
-            }
-            QTableWidget::item {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-                padding: 8px;
-            }
-            QTableWidget::item:selected {
-                background-color: #7c3aed;
-                color: white;
-            }
-        """)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
 
         self.table.itemSelectionChanged.connect(self.on_selection_changed)
         self.table.itemDoubleClicked.connect(self.on_item_double_clicked)
@@ -159,38 +154,24 @@ class InventoryTab(QWidget):
                 brand_text = f"{filament['brand']} - {filament_type}"
             else:
                 brand_text = filament['brand']
-            brand_item = QTableWidgetItem(brand_text)
+            brand_item = self._bold_cell_proto.clone()
+            brand_item.setText(brand_text)
             brand_item.setData(Qt.UserRole, filament['id'])
-            brand_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            brand_item.setTextAlignment(Qt.AlignCenter)
-            font = brand_item.font()
-            font.setPointSize(12)
-            font.setBold(True)
-            brand_item.setFont(font)
             self.table.setItem(row, 1, brand_item)
 
             # Initial weight column
-            initial_weight_item = QTableWidgetItem(f"{filament['initial_weight']} g")
-            initial_weight_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            initial_weight_item.setTextAlignment(Qt.AlignCenter)
-            font = initial_weight_item.font()
-            font.setPointSize(12)
-            initial_weight_item.setFont(font)
+            initial_weight_item = self._cell_proto.clone()
+            initial_weight_item.setText(f"{filament['initial_weight']} g")
             self.table.setItem(row, 2, initial_weight_item)
 
-            # Current weight column
-            current_weight_item = QTableWidgetItem(f"{filament['current_weight']} g")
-            current_weight_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            current_weight_item.setTextAlignment(Qt.AlignCenter)
-            font = current_weight_item.font()
-            font.setPointSize(12)
+            # Current weight column (bold once some filament has been used)
             if filament['current_weight'] < filament['initial_weight']:
-                font.setBold(True)
-            current_weight_item.setFont(font)
+                current_weight_item = self._bold_cell_proto.clone()
+            else:
+                current_weight_item = self._cell_proto.clone()
+            current_weight_item.setText(f"{filament['current_weight']} g")
             self.table.setItem(row, 3, current_weight_item)
 
-        self.table.resizeRowsToContents()
-
     def on_selection_changed(self):
         """Handle table selection change."""
         has_selection = len(self.table.selectedItems()) > 0
@@ -222,6 +203,8 @@ class InventoryTab(QWidget):
             # Refresh calculator tab filament list
             if self.main_window:
                 self.main_window.refresh_calculator_filaments()
+                self.main_window.mark_dirty(2)  # History shows filament names
+        dialog.deleteLater()
 
     def show_edit_filament_dialog(self):
         """Show dialog for editing selected filament."""
@@ -233,6 +216,7 @@ class InventoryTab(QWidget):
                 # Refresh calculator tab filament list
                 if self.main_window:
                     self.main_window.refresh_calculator_filaments()
+                    self.main_window.mark_dirty(2)  # History shows filament names
 
     def show_brands_dialog(self):
         """Show dialog for managing brands."""
@@ -248,6 +232,12 @@ class InventoryTab(QWidget):
         if filament_id:
             dialog = FilamentHistoryDialog(filament_id, self)
             dialog.exec_()
+            # Deleting a print restores filament weight and removes a history row
+            if dialog.data_changed:
+                self.refresh_table()
+                if self.main_window:
+                    self.main_window.refresh_calculator_filaments()
+                    self.main_window.mark_dirty(2)
 
     def delete_selected_filament(self):
         """Delete selected filament after confirmation."""
@@ -279,6 +269,7 @@ class InventoryTab(QWidget):
                     # Refresh calculator tab filament list
                     if self.main_window:
                         self.main_window.refresh_calculator_filaments()
+                        self.main_window.mark_dirty(2)  # History shows filament names
                 else:
                     QMessageBox.warning(self, t("error"), t("delete_failed"))
             except Exception as e:
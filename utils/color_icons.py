@@ -0,0 +1,46 @@
+"""
+Colored square icons shared by tabs and dialogs.
+"""
+
+import functools
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QIcon, QPainter, QPixmap
+
+
+def create_color_icon(color_hex: str, size: int = 16, inset: int = 0) -> QIcon:
+    """
+    Create a square color icon (cached per color, size and inset).
+
+    Args:
+        color_hex: Color as '#RRGGBB' or 'RRGGBB', any case
+        size: Icon width and height in pixels
+        inset: Transparent border around the filled square in pixels
+
+    Returns:
+        Shared QIcon; callers must not modify it
+    """
+    if not color_hex.startswith('#'):
+        color_hex = '#' + color_hex
+    # Normalize so "ff0000", "#FF0000" and "#ff0000" share one cache entry
+    return _cached_color_icon(color_hex.upper(), size, inset)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_color_icon(color_hex: str, size: int, inset: int) -> QIcon:
+    """Render the icon for a normalized '#RRGGBB' color."""
+    color = QColor(color_hex)
+    if not color.isValid():
+        color = QColor("#000000")
+
+    pixmap = QPixmap(size, size)
+    if inset:
+        # Transparent canvas with a solid inner square; fillRect needs no pen,
+        # brush or antialiasing for an axis-aligned rect
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.fillRect(inset, inset, size - 2 * inset, size - 2 * inset, color)
+        painter.end()
+    else:
+        pixmap.fill(color)
+    return QIcon(pixmap)
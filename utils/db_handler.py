@@ -3,6 +3,7 @@ Database handler for PrintManager application.
 Manages JSON-based storage for filaments, brands, and print history.
 """
 
+import functools
 import json
 import os
 import uuid
@@ -38,13 +39,17 @@ def _load_json(file_path: str, default: Dict) -> Dict:
 
 
 def _save_json(file_path: str, data: Dict):
-    """Save data to JSON file."""
+    """Save data to JSON file atomically (background loaders never see a half-written file)."""
     _ensure_data_dir()
+    tmp_path = f"{file_path}.tmp"
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, file_path)
     except Exception as e:
         print(f"Error saving {file_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         raise
 
 
@@ -55,19 +60,44 @@ def load_brands() -> List[Dict]:
     return data.get("brands", [])
 
 
+@functools.lru_cache(maxsize=1)
+def _brand_spool_weights() -> Dict[str, int]:
+    """Brand name -> spool weight, read once and kept until brands change."""
+    weights = {}
+    for brand in load_brands():
+        weights.setdefault(brand["name"], brand.get("spool_weight", 150))
+    return weights
+
+
+# Bumped on every brand write so UI-side caches can tell when to rebuild
+_brands_version = 0
+
+
+def invalidate_brand_cache():
+    """Drop cached brand data (called after every brand write)."""
+    global _brands_version
+    _brand_spool_weights.cache_clear()
+    _brands_version += 1
+
+
+def get_brands_version() -> int:
+    """Get a counter that changes whenever brands are added, updated or deleted."""
+    return _brands_version
+
+
 def get_all_brands() -> List[str]:
     """Get list of all brand names."""
-    brands = load_brands()
-    return [brand["name"] for brand in brands]
+    return list(_brand_spool_weights())
 
 
 def get_spool_weight(brand_name: str) -> int:
     """Get spool weight for a specific brand."""
-    brands = load_brands()
-    for brand in brands:
-        if brand["name"] == brand_name:
-            return brand.get("spool_weight", 150)
-    return 150  # Default spool weight
+    return _brand_spool_weights().get(brand_name, 150)  # Default spool weight
+
+
+def get_brand_spool_weights() -> Dict[str, int]:
+    """Get mapping of brand name -> spool weight for all brands (in storage order)."""
+    return dict(_brand_spool_weights())
 
 
 def add_brand(name: str, spool_weight: int):
@@ -78,6 +108,9 @@ def add_brand(name: str, spool_weight: int):
         name: Brand name
         spool_weight: Spool weight in grams
         
+    Returns:
+        The stored brand dict
+        
     Raises:
         ValueError: If brand with same name already exists
     """
@@ -98,6 +131,8 @@ def add_brand(name: str, spool_weight: int):
     
     brands.append(new_brand)
     _save_json(BRANDS_FILE, {"brands": brands})
+    invalidate_brand_cache()
+    return new_brand
 
 
 def get_brand_by_id(brand_id: str) -> Optional[Dict]:
@@ -126,6 +161,9 @@ def update_brand(brand_id: str, name: str, spool_weight: int):
         name: New brand name
         spool_weight: New spool weight in grams
         
+    Returns:
+        The updated brand dict
+        
     Raises:
         ValueError: If brand not found or brand with same name already exists
     """
@@ -154,6 +192,8 @@ def update_brand(brand_id: str, name: str, spool_weight: int):
     })
     
     _save_json(BRANDS_FILE, {"brands": brands})
+    invalidate_brand_cache()
+    return brands[brand_index]
 
 
 def delete_brand(brand_id: str) -> bool:
@@ -194,6 +234,7 @@ def delete_brand(brand_id: str) -> bool:
     # Remove brand
     brands = [b for b in brands if b.get("id") != brand_id]
     _save_json(BRANDS_FILE, {"brands": brands})
+    invalidate_brand_cache()
     
     return True
 
@@ -205,6 +246,19 @@ def load_filaments() -> List[Dict]:
     return data.get("filaments", [])
 
 
+def load_filaments_for_display() -> List[Dict]:
+    """Load filaments as copies with a precomputed 'display_text' ("Brand - Type" or "Brand").
+
+    Copies are returned so the extra key never gets written back to storage.
+    """
+    result = []
+    for filament in load_filaments():
+        filament_type = filament.get("type", "")
+        display_text = f"{filament['brand']} - {filament_type}" if filament_type else filament["brand"]
+        result.append(dict(filament, display_text=display_text))
+    return result
+
+
 def get_filament_by_id(filament_id: str) -> Optional[Dict]:
     """Get filament by ID."""
     filaments = load_filaments()
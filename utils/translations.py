@@ -4,6 +4,7 @@ Supports Polish (PL) and English (EN) languages.
 Also includes currency management.
 """
 
+import functools
 import json
 import os
 from typing import Dict, Callable, List
@@ -299,8 +300,14 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
 
 def get_text(key: str) -> str:
     """Get translated text for the current language."""
+    return _lookup_text(_current_language, key)
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup_text(language: str, key: str) -> str:
+    """Translation lookup memoized per (language, key); TRANSLATIONS never changes at runtime."""
     if key in TRANSLATIONS:
-        return TRANSLATIONS[key].get(_current_language, TRANSLATIONS[key].get("PL", key))
+        return TRANSLATIONS[key].get(language, TRANSLATIONS[key].get("PL", key))
     return key
 
 
@@ -312,6 +319,8 @@ def get_language() -> str:
 def set_language(lang: str):
     """Set current language and notify all registered callbacks."""
     global _current_language
+    if lang == _current_language:
+        return  # Nothing to retranslate
     if lang in ["PL", "EN"]:
         _current_language = lang
         # Save preferences
@@ -435,9 +444,16 @@ def get_font_size_px(size_type: str = "base") -> int:
 
 def format_currency(value: float) -> str:
     """Format a value in the current currency."""
-    converted = value * get_exchange_rate()
-    symbol = get_currency_symbol()
-    position = get_currency_position()
+    return _format_currency(_current_currency, value)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_currency(currency: str, value: float) -> str:
+    """Formatting memoized per (currency, value); CURRENCIES rates are fixed."""
+    info = CURRENCIES[currency]
+    converted = value * info["rate"]
+    symbol = info["symbol"]
+    position = info["position"]
     
     if position == "before":
         return f"{symbol}{converted:.2f}"